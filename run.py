@@ -1,3050 +1,2669 @@
-import pyautogui
-import time
-import random
+import argparse
+import bisect
+import contextlib
+import copy
+import itertools
+import json
+import mmap
+import os
+import platform
+import re
+import shutil
+import subprocess
 import sys
-
-# Enable the mouse fail-safe
-pyautogui.FAILSAFE = True
-
-def press_cmd_s():
-    pyautogui.hotkey('command', 's')  # macOS save
-    print("💾 (Cmd+S) Save triggered")
-    time.sleep(random.uniform(0.5, 1.2))  # small delay after saving
-
-def hyper_slow_typing_with_saves(text):
+import threading
+import time
+import tracemalloc
+
+import numpy as np
+
+# Editor/OS key profiles: logical action -> steps, where a tuple is a chord and
+# a string is typed as-is. None means the editor has no keys for that action
+KEY_PROFILES = {
+    'vscode-macos': {'save': [('command', 's')], 'paste': [('command', 'v')]},
+    'vscode-linux': {'save': [('ctrl', 's')], 'paste': [('ctrl', 'v')]},
+    'vscode-windows': {'save': [('ctrl', 's')], 'paste': [('ctrl', 'v')]},
+    # Save: leave insert mode, run the command, then append again where we
+    # were. Paste: Ctrl-R Ctrl-O inserts the register literally, without
+    # auto-indenting each line again
+    'vim': {'save': [('esc',), ':w\n', 'a'], 'paste': [('ctrl', 'r'), ('ctrl', 'o'), '+']},
+    'nano': {'save': [('ctrl', 'o'), ('enter',)], 'paste': [('ctrl', 'shift', 'v')]},
+    # FileBackend takes a bare 'save' key; there is no editor to drive
+    'file': {'save': [('save',)], 'paste': None},
+}
+
+
+# Editing keys the keystroke planner mixes into typed text, each one a
+# private-use character so a planned line is still a plain string. NEXT_LINE
+# only ever ends a line, standing in for its newline
+NEXT_LINE = '\ue000'
+END_KEY = '\ue001'
+HOME_KEY = '\ue002'
+DELETE_KEY = '\ue003'
+BACKSPACE_KEY = '\ue004'
+DELETE_TO_END = '\ue005'
+DELETE_ROW_BELOW = '\ue006'
+EDIT_KEYS = {
+    NEXT_LINE: [('down',), ('end',)],
+    END_KEY: [('end',)],
+    HOME_KEY: [('home',)],
+    DELETE_KEY: [('delete',)],
+    BACKSPACE_KEY: [('backspace',)],
+    DELETE_TO_END: [('shift', 'end'), ('delete',)],
+    # From the end of a line: select through the end of the next one, delete
+    DELETE_ROW_BELOW: [('shift', 'down'), ('shift', 'end'), ('delete',)],
+}
+
+
+def detect_profile():
+    # TYPING_PROFILE wins, otherwise VS Code on whatever OS this is
+    name = os.environ.get('TYPING_PROFILE')
+    if name:
+        return name
+    if sys.platform == 'darwin':
+        return 'vscode-macos'
+    if sys.platform.startswith('win'):
+        return 'vscode-windows'
+    return 'vscode-linux'
+
+
+def send_keys(backend, steps):
+    for step in steps:
+        if isinstance(step, tuple):
+            backend.hotkey(*step)
+        else:
+            backend.type_text(step)
+
+
+def perform(backend, keys, action):
+    # Sends a logical action; False when the profile has no keys for it
+    steps = keys.get(action)
+    if not steps:
+        return False
+    send_keys(backend, steps)
+    return True
+
+
+# Seconds the editor gets to read the clipboard before it is restored
+CLIPBOARD_SETTLE = 0.3
+
+
+def clipboard_paste(backend, text, steps):
+    # Paste through the system clipboard, then put back whatever was there
+    import pyperclip
+
+    previous = pyperclip.paste()
+    pyperclip.copy(text)
     try:
-        print("⌨️ Typing starts in 5 seconds. Focus VS Code and move mouse to top-left to cancel.")
-        time.sleep(5)
-
-        lines = text.strip().split('\n')
-        for i, line in enumerate(lines):
-            for char in line + '\n':
-                pyautogui.write(char)
-                time.sleep(random.uniform(0.4, 0.8))
-
-                if char in [';', '{', '}', ')']:
-                    time.sleep(random.uniform(1.5, 2.5))
-
-            # Line pause
-            time.sleep(random.uniform(2.5, 5.5))
+        send_keys(backend, steps)
+        getattr(backend, 'sleep', time.sleep)(CLIPBOARD_SETTLE)
+    finally:
+        pyperclip.copy(previous)
+
+
+# Backends share one interface: begin(chars_typed) before the first key (chars
+# already typed when resuming), type_text(text, interval) which waits interval
+# between keys (the gap after the last one belongs to the scheduler),
+# paste(text, steps) for a whole block at once (steps being the profile's
+# paste keys), hotkey(*keys) and flush(). type_text keeps in sent how many of
+# its keys went out, so an interrupt between two of them loses none. A
+# backend that is not driving an editor names its own key profile
+class PyAutoGUIBackend:
+    # Real keystrokes into whatever window has focus. The backend owns its
+    # fail-safe: a FailSafeMonitor of its own unless one is passed in, or
+    # pyautogui's built-in check before every key with failsafe=False
+    name = 'pyautogui'
+    profile = None
+
+    def __init__(self, sleep=None, failsafe=None):
+        # Imported here: pyautogui drags in PIL and Xlib and needs a display
+        import pyautogui
+
+        if failsafe is None:
+            failsafe = FailSafeMonitor()
+        if failsafe:
+            # The monitor polls the pointer on a thread instead of pyautogui
+            # querying it before every key
+            pyautogui.FAILSAFE = False
+        self.pyautogui = pyautogui
+        self.failsafe = failsafe or None
+        self.sleep = sleep or (failsafe.sleep if failsafe else time.sleep)
+        self.sent = 0
+
+    def begin(self, chars_typed):
+        pass
+
+    def type_text(self, text, interval=0.0):
+        # pyautogui.write would sleep after the last key and add PAUSE on top;
+        # the scheduler owns both gaps, so press keys directly without either
+        self.sent = 0
+        for i, char in enumerate(text):
+            if i and interval:
+                self.sent = i
+                self.sleep(interval)
+            if char in EDIT_KEYS:
+                send_keys(self, EDIT_KEYS[char])
+            else:
+                self.pyautogui.press(char, _pause=False)
+        self.sent = len(text)
+
+    def paste(self, text, steps):
+        clipboard_paste(self, text, steps)
+
+    def hotkey(self, *keys):
+        self.pyautogui.hotkey(*keys, _pause=False)
+
+    def flush(self):
+        pass
+
+
+class RecorderBackend:
+    # Keeps every event in memory as (timestamp, kind, payload); no desktop needed
+    name = 'recorder'
+    profile = None
+
+    def __init__(self, clock=time.monotonic, sleep=time.sleep):
+        self.clock = clock
+        self.sleep = sleep
+        self.events = []
+        self.sent = 0
+
+    def begin(self, chars_typed):
+        pass
+
+    def type_text(self, text, interval=0.0):
+        self.sent = 0
+        for i, char in enumerate(text):
+            if i and interval:
+                self.sent = i
+                self.sleep(interval)
+            self.events.append((self.clock(), 'type', char))
+        self.sent = len(text)
+
+    def paste(self, text, steps=None):
+        self.events.append((self.clock(), 'paste', text))
+
+    def hotkey(self, *keys):
+        self.events.append((self.clock(), 'hotkey', keys))
+
+    def flush(self):
+        self.events.append((self.clock(), 'flush', None))
+
+    @property
+    def text(self):
+        return ''.join(payload for _, kind, payload in self.events if kind in ('type', 'paste'))
+
+
+class NullBackend:
+    # Counts what it is sent and drops it, so a benchmark sees only the
+    # engine's own time and memory, however long the payload
+    name = 'null'
+    profile = None
+
+    def __init__(self, sleep=time.sleep):
+        self.sleep = sleep
+        self.keys = 0
+        self.pastes = 0
+        self.hotkeys = 0
+        self.sent = 0
+
+    def begin(self, chars_typed):
+        pass
+
+    def type_text(self, text, interval=0.0):
+        self.keys += len(text)
+        self.sent = len(text)
+        if interval and len(text) > 1:
+            self.sleep(interval * (len(text) - 1))
+
+    def paste(self, text, steps=None):
+        self.pastes += 1
+
+    def hotkey(self, *keys):
+        self.hotkeys += 1
+
+    def flush(self):
+        pass
+
+
+class FileBackend:
+    # Writes the text straight into the target file, no GUI involved. A save
+    # chord becomes flush + fsync, or every fsync_every saves when batched
+    name = 'file'
+    profile = 'file'
+
+    def __init__(self, path, fsync_every=1, sleep=time.sleep):
+        self.path = path
+        self.fsync_every = fsync_every
+        self.sleep = sleep
+        self.file = None
+        self.saves = 0
+        self.sent = 0
+
+    def begin(self, chars_typed):
+        # Keep exactly what earlier attempts typed, dropping anything past it.
+        # Text the checkpoint counts but the file lost (a crash before the
+        # buffer reached disk) can't be retyped from here, so refuse
+        self.close()
+        if not chars_typed:
+            self.file = open(self.path, 'w', encoding='utf-8', newline='')
+            return
+        try:
+            self.file = open(self.path, 'r+', encoding='utf-8', newline='')
+        except FileNotFoundError:
+            raise ValueError(f"Cannot resume into {self.path}: the file is gone") from None
+        kept = len(self.file.read(chars_typed))
+        if kept < chars_typed:
+            self.close()
+            raise ValueError(f"Cannot resume into {self.path}: it holds {kept} of the {chars_typed} "
+                             f"characters the checkpoint recorded")
+        self.file.seek(self.file.tell())
+        self.file.truncate()
+
+    def type_text(self, text, interval=0.0):
+        self.file.write(text)
+        self.sent = len(text)
+        if interval and len(text) > 1:
+            self.sleep(interval * (len(text) - 1))
+
+    def paste(self, text, steps=None):
+        self.file.write(text)
+
+    def hotkey(self, *keys):
+        if keys != ('save',):
+            return
+        self.file.flush()
+        self.saves += 1
+        if self.saves % self.fsync_every == 0:
+            os.fsync(self.file.fileno())
+
+    def flush(self):
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+# pyautogui key names -> X keysym names, plus characters without a Latin-1 keysym
+X11_KEY_NAMES = {
+    'command': 'Super_L',
+    'win': 'Super_L',
+    'ctrl': 'Control_L',
+    'alt': 'Alt_L',
+    'shift': 'Shift_L',
+    'enter': 'Return',
+    'return': 'Return',
+    'esc': 'Escape',
+    'tab': 'Tab',
+    'space': 'space',
+    'backspace': 'BackSpace',
+    'delete': 'Delete',
+    'home': 'Home',
+    'end': 'End',
+    'down': 'Down',
+    '\n': 'Return',
+    '\t': 'Tab',
+}
+
+
+class XTestBackend:
+    # Fake key events over one persistent XTest connection (X11 only). The
+    # keyboard map is read once up front, and events are flushed per call
+    # rather than per key unless an interval forces them out one by one
+    name = 'xtest'
+    profile = None
+
+    def __init__(self, display=None, sleep=time.sleep):
+        from Xlib import X, XK, display as xdisplay
+        from Xlib.ext import xtest
+
+        self.X = X
+        self.XK = XK
+        self.fake_input = xtest.fake_input
+        self.display = xdisplay.Display(display)
+        # A second connection for pointer queries from the fail-safe thread,
+        # since one Xlib connection is not safe to share between threads
+        self.pointer_display = xdisplay.Display(display)
+        self.sleep = sleep
+
+        # keysym -> (keycode, needs shift), first match wins
+        self.keysyms = {}
+        info = self.display.display.info
+        count = info.max_keycode - info.min_keycode + 1
+        for offset, keysyms in enumerate(self.display.get_keyboard_mapping(info.min_keycode, count)):
+            for level, keysym in enumerate(keysyms[:2]):
+                if keysym and keysym not in self.keysyms:
+                    self.keysyms[keysym] = (info.min_keycode + offset, level == 1)
+        self.shift = self.keysyms[XK.XK_Shift_L][0]
+        self.keys = {}
+        self.sent = 0
+
+    def key(self, name):
+        if name not in self.keys:
+            if name in X11_KEY_NAMES:
+                keysym = self.XK.string_to_keysym(X11_KEY_NAMES[name])
+            elif len(name) == 1:
+                code = ord(name)
+                keysym = code if code < 0x100 else 0x01000000 | code
+            else:
+                keysym = self.XK.string_to_keysym(name)
+            if keysym not in self.keysyms:
+                raise ValueError(f"No keycode for {name!r} in the current keyboard map")
+            self.keys[name] = self.keysyms[keysym]
+        return self.keys[name]
+
+    def begin(self, chars_typed):
+        pass
+
+    def type_text(self, text, interval=0.0):
+        press, release = self.X.KeyPress, self.X.KeyRelease
+        self.sent = 0
+        for i, char in enumerate(text):
+            if i and interval:
+                self.display.flush()
+                self.sent = i
+                self.sleep(interval)
+            if char in EDIT_KEYS:
+                send_keys(self, EDIT_KEYS[char])
+                continue
+            keycode, shifted = self.key(char)
+            if shifted:
+                self.fake_input(self.display, press, self.shift)
+            self.fake_input(self.display, press, keycode)
+            self.fake_input(self.display, release, keycode)
+            if shifted:
+                self.fake_input(self.display, release, self.shift)
+        self.display.flush()
+        self.sent = len(text)
+
+    def paste(self, text, steps):
+        clipboard_paste(self, text, steps)
+
+    def hotkey(self, *keys):
+        keycodes = [self.key(name)[0] for name in keys]
+        for keycode in keycodes:
+            self.fake_input(self.display, self.X.KeyPress, keycode)
+        for keycode in reversed(keycodes):
+            self.fake_input(self.display, self.X.KeyRelease, keycode)
+        self.display.flush()
+
+    def flush(self):
+        # Round-trip so every queued event has reached the server
+        self.display.sync()
+
+    def pointer_position(self):
+        pointer = self.pointer_display.screen().root.query_pointer()
+        return pointer.root_x, pointer.root_y
+
+    def screen_corners(self):
+        # The screen's corner pixels, like pyautogui.FAILSAFE_POINTS
+        screen = self.pointer_display.screen()
+        right, bottom = screen.width_in_pixels - 1, screen.height_in_pixels - 1
+        return [(0, 0), (0, bottom), (right, 0), (right, bottom)]
+
+
+def latency_summary(name, samples_ns):
+    p50, p99 = np.percentile(samples_ns, [50, 99]) / 1e3
+    return {
+        'backend': name,
+        'keys': len(samples_ns),
+        'mean_us': float(samples_ns.mean() / 1e3),
+        'p50_us': float(p50),
+        'p99_us': float(p99),
+    }
+
+
+def measure_key_latency(backend, text):
+    # Per-key time from the call until the backend reports it delivered
+    backend.begin(0)
+    samples = np.empty(len(text))
+    for i, char in enumerate(text):
+        start = time.perf_counter_ns()
+        backend.type_text(char)
+        backend.flush()
+        samples[i] = time.perf_counter_ns() - start
+    return latency_summary(backend.name, samples)
+
+
+LATENCY_SAMPLE = 'export const answer = (value) => { return value * 42; };\n'
+
+
+def xtest_latency_benchmark(text=LATENCY_SAMPLE):
+    # Needs an X display; on a headless box run under Xvfb:
+    #   xvfb-run python run.py --bench-xtest
+    return [measure_key_latency(backend, text) for backend in (XTestBackend(), PyAutoGUIBackend())]
+
+
+# US layout: character -> (evdev key name, needs shift)
+EVDEV_KEYMAP = {' ': ('KEY_SPACE', False), '\n': ('KEY_ENTER', False), '\t': ('KEY_TAB', False)}
+for _letter in 'abcdefghijklmnopqrstuvwxyz':
+    EVDEV_KEYMAP[_letter] = ('KEY_' + _letter.upper(), False)
+    EVDEV_KEYMAP[_letter.upper()] = ('KEY_' + _letter.upper(), True)
+for _plain, _shifted, _name in zip(
+        '1234567890-=[]\\;\',./`', '!@#$%^&*()_+{}|:"<>?~',
+        ['KEY_1', 'KEY_2', 'KEY_3', 'KEY_4', 'KEY_5', 'KEY_6', 'KEY_7', 'KEY_8', 'KEY_9', 'KEY_0',
+         'KEY_MINUS', 'KEY_EQUAL', 'KEY_LEFTBRACE', 'KEY_RIGHTBRACE', 'KEY_BACKSLASH', 'KEY_SEMICOLON',
+         'KEY_APOSTROPHE', 'KEY_COMMA', 'KEY_DOT', 'KEY_SLASH', 'KEY_GRAVE']):
+    EVDEV_KEYMAP[_plain] = (_name, False)
+    EVDEV_KEYMAP[_shifted] = (_name, True)
+
+# pyautogui key names used in hotkeys -> evdev key names
+EVDEV_KEY_NAMES = {
+    'command': 'KEY_LEFTMETA',
+    'win': 'KEY_LEFTMETA',
+    'ctrl': 'KEY_LEFTCTRL',
+    'alt': 'KEY_LEFTALT',
+    'shift': 'KEY_LEFTSHIFT',
+    'enter': 'KEY_ENTER',
+    'return': 'KEY_ENTER',
+    'esc': 'KEY_ESC',
+    'tab': 'KEY_TAB',
+    'space': 'KEY_SPACE',
+    'backspace': 'KEY_BACKSPACE',
+    'delete': 'KEY_DELETE',
+    'home': 'KEY_HOME',
+    'end': 'KEY_END',
+    'down': 'KEY_DOWN',
+}
+
+
+class UInputBackend:
+    # A virtual keyboard on /dev/uinput fed raw evdev events: no X round trips,
+    # and it works under Wayland too. Needs write access to /dev/uinput
+    name = 'uinput'
+    profile = None
+
+    def __init__(self, sleep=time.sleep):
+        from evdev import UInput, ecodes
+
+        self.ecodes = ecodes
+        self.sleep = sleep
+        names = {name for name, _ in EVDEV_KEYMAP.values()} | set(EVDEV_KEY_NAMES.values())
+        self.ui = UInput({ecodes.EV_KEY: sorted(ecodes.ecodes[name] for name in names)}, name='synapse-typer')
+        self.shift = ecodes.KEY_LEFTSHIFT
+        self.keys = {char: (ecodes.ecodes[name], shifted) for char, (name, shifted) in EVDEV_KEYMAP.items()}
+        self.sent = 0
+
+    def key(self, name):
+        if name in EVDEV_KEY_NAMES:
+            return self.ecodes.ecodes[EVDEV_KEY_NAMES[name]]
+        if name in self.keys:
+            return self.keys[name][0]
+        raise ValueError(f"No evdev key for {name!r}")
+
+    def tap(self, code, value):
+        self.ui.write(self.ecodes.EV_KEY, code, value)
+        self.ui.syn()
+
+    def begin(self, chars_typed):
+        pass
+
+    def type_text(self, text, interval=0.0):
+        self.sent = 0
+        for i, char in enumerate(text):
+            if i and interval:
+                self.sent = i
+                self.sleep(interval)
+            if char in EDIT_KEYS:
+                send_keys(self, EDIT_KEYS[char])
+                continue
+            if char not in self.keys:
+                raise ValueError(f"No evdev key for {char!r} on a US layout")
+            code, shifted = self.keys[char]
+            if shifted:
+                self.tap(self.shift, 1)
+            self.tap(code, 1)
+            self.tap(code, 0)
+            if shifted:
+                self.tap(self.shift, 0)
+        self.sent = len(text)
+
+    def paste(self, text, steps):
+        clipboard_paste(self, text, steps)
+
+    def hotkey(self, *keys):
+        codes = [self.key(name) for name in keys]
+        for code in codes:
+            self.tap(code, 1)
+        for code in reversed(codes):
+            self.tap(code, 0)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.ui.close()
+
+
+def uinput_latency_benchmark(text=LATENCY_SAMPLE):
+    # Reads every key back from the virtual keyboard's own evdev node and times
+    # write -> delivery. The node is grabbed so nothing reaches the focused window
+    import select
+
+    backend = UInputBackend()
+    reader = backend.ui.device
+    reader.grab()
+    try:
+        samples = np.empty(len(text))
+        for i, char in enumerate(text):
+            code = backend.keys[char][0]
+            start = time.perf_counter_ns()
+            backend.type_text(char)
+            released = False
+            while not released:
+                select.select([reader.fd], [], [])
+                for event in reader.read():
+                    if event.type == backend.ecodes.EV_KEY and event.code == code and event.value == 0:
+                        released = True
+            samples[i] = time.perf_counter_ns() - start
+    finally:
+        reader.ungrab()
+        backend.close()
+    return latency_summary(backend.name, samples)
+
+
+def measure_chars_per_second(backend, text):
+    # Raw backend throughput with no pacing, for comparing backends
+    backend.begin(0)
+    start = time.perf_counter()
+    backend.type_text(text)
+    backend.flush()
+    elapsed = time.perf_counter() - start
+    return len(text) / elapsed if elapsed > 0 else float('inf')
+
+
+# Pointer polls per second for the fail-safe, i.e. about 50 ms to abort
+FAILSAFE_RATE = 20
+
+# Named speeds: how much faster than the schedule's natural timing to type.
+# None turns pacing off entirely, start delay included
+SPEED_PROFILES = {'natural': 1.0, 'brisk': 2.0, 'fast': 5.0, 'instant': None}
+
+# Characters that get an extra "thinking" pause after them
+PAUSE_CHARS = ';{})'
+
+# Seconds to focus the editor before the first key
+START_DELAY = 5
+
+# Ordinary characters are sent in runs of up to this many per backend call
+CHUNK_SIZE = 8
+
+# Lines compiled per schedule block, so memory stays flat on huge payloads
+BLOCK_LINES = 512
+
+CHECKPOINT_PATH = '.typing_checkpoint.json'
+
+# Wall-clock seconds between checkpoint writes that aren't at an editor save;
+# at human pace every line is slower than this, with pacing off the fsync
+# would otherwise cost more than typing the line
+CHECKPOINT_INTERVAL = 1.0
+
+SAMPLE_PAYLOAD = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sample_payload.txt')
+
+
+def iter_text_lines(text):
+    # text.split('\n') without building the list
+    start = 0
+    while True:
+        end = text.find('\n', start)
+        if end < 0:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
+
+
+def iter_file_lines(path):
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for raw in iter(mm.readline, b''):
+                yield raw.decode('utf-8').rstrip('\r\n')
+
+
+def strip_lines(lines):
+    # Lazy equivalent of text.strip().split('\n'): blank lines are held back
+    # until a non-blank one follows, so trailing ones are dropped
+    pending = None
+    blanks = []
+    for line in lines:
+        if not line.strip():
+            if pending is not None:
+                blanks.append(line)
+            continue
+        if pending is None:
+            pending = line.lstrip()
+            continue
+        yield pending
+        yield from blanks
+        blanks = []
+        pending = line
+    yield pending.rstrip() if pending is not None else ''
+
+
+class Payload:
+    # A payload from a file path (memory-mapped), '-' for stdin, text or any
+    # iterable of lines. Lines are streamed, never held all at once. Text is
+    # passed through from_text; a str with a newline in it can't be a path
+    # and counts as text too, any other str has to name an existing file
+    def __init__(self, source, text=False):
+        if isinstance(source, str) and '\n' in source:
+            text = True
+        if not text and (isinstance(source, os.PathLike) or (isinstance(source, str) and source != '-')):
+            if not os.path.isfile(source):
+                raise FileNotFoundError(f"No such payload file: {os.fspath(source)}")
+        self.source = source
+        self.text = text
+        if text or isinstance(source, (str, os.PathLike)):
+            self.rereadable = text or source != '-'
+        else:
+            self.rereadable = iter(source) is not source
+
+    @classmethod
+    def from_text(cls, text):
+        return cls(text, text=True)
+
+    @property
+    def path(self):
+        source = self.source
+        if self.text or not isinstance(source, (str, os.PathLike)) or source == '-':
+            return None
+        return os.fspath(source)
+
+    def raw_lines(self):
+        source = self.source
+        if self.text:
+            return iter_text_lines(source)
+        if source == '-':
+            return (line.rstrip('\r\n') for line in sys.stdin)
+        if self.path is not None:
+            return iter_file_lines(self.path)
+        return (line.rstrip('\r\n') for line in source)
+
+    def lines(self):
+        return strip_lines(self.raw_lines())
+
+
+def open_payload(source):
+    return source if isinstance(source, Payload) else Payload(source)
+
+
+# The template family of the sample payload. Each block is one template with
+# {n} replaced by the block's number
+PAYLOAD_HEADER = "import React from 'react';"
+PAYLOAD_TEMPLATES = (
+    ("export function utilFunc{n}_truncate(text, length = 100) {",
+     "  return text.length > length ? text.slice(0, length) + '...' : text;",
+     "}"),
+    ("export function utilFunc{n}_capitalize(text) {",
+     "  return text.charAt(0).toUpperCase() + text.slice(1);",
+     "}"),
+    ("export function utilFunc{n}_debounce(func, delay) {",
+     "  let timer;",
+     "  return (...args) => {",
+     "    clearTimeout(timer);",
+     "    timer = setTimeout(() => func.apply(this, args), delay);",
+     "  };",
+     "}"),
+    ("export function utilFunc{n}_formatDate(date) {",
+     "  return new Date(date).toLocaleDateString();",
+     "}"),
+    ("export function utilFunc{n}_isEmailValid(email) {",
+     "  return /^[^@]+@[^@]+[^@]+$/.test(email);",
+     "}"),
+    ("export const Component{n}_Alert = ({ message, type }) => (",
+     "  <div className={`alert alert-${type}`}>{message}</div>",
+     ");"),
+    ("export const Component{n}_Input = ({ label, value, onChange }) => (",
+     "  <label>{label}<input value={value} onChange={onChange} /></label>",
+     ");"),
+    ("export const Component{n}_Card = ({ title, content }) => (",
+     '  <div className="card">',
+     "    <h3>{title}</h3>",
+     "    <p>{content}</p>",
+     "  </div>",
+     ");"),
+    ("export const Component{n}_Loader = () => (",
+     '  <div className="loader">Loading...</div>',
+     ");"),
+    ("export const Component{n}_Button = ({ onClick, children }) => (",
+     '  <button onClick={onClick} className="btn">{children}</button>',
+     ");"),
+)
+
+
+class SyntheticPayload:
+    # At least `lines` lines of blocks drawn from PAYLOAD_TEMPLATES by a seeded
+    # RNG and numbered without gaps, after PAYLOAD_HEADER. Iterating generates
+    # them afresh each time, so it passes as a rereadable Payload source of
+    # any size while holding one batch of template choices at a time
+    def __init__(self, lines, seed=0):
+        self.line_count = lines
+        self.seed = seed
+
+    def __repr__(self):
+        return f"SyntheticPayload({self.line_count}, seed={self.seed})"
+
+    def __iter__(self):
+        rng = np.random.default_rng(self.seed)
+        yield PAYLOAD_HEADER
+        count = 1
+        number = 0
+        while count < self.line_count:
+            for choice in rng.integers(len(PAYLOAD_TEMPLATES), size=BLOCK_LINES).tolist():
+                if count >= self.line_count:
+                    return
+                yield ''
+                for line in PAYLOAD_TEMPLATES[choice]:
+                    yield line.replace('{n}', str(number))
+                count += 1 + len(PAYLOAD_TEMPLATES[choice])
+                number += 1
+
+
+def mark_paste_lines(lines, regions=(), threshold=None):
+    # Pairs each line with whether it goes in by clipboard paste instead of
+    # being typed: lines inside a (start, end) region, or any blank-line
+    # separated block of at least threshold characters. A block is held back
+    # only until it is known to cross the threshold
+    held = []
+    size = 0
+    for number, line in enumerate(lines):
+        in_region = any(start <= number < end for start, end in regions)
+        if threshold is None:
+            yield line, in_region
+        elif not line.strip():
+            yield from held
+            held, size = [], 0
+            yield line, in_region
+        elif size >= threshold:
+            yield line, True
+        else:
+            held.append((line, in_region))
+            size += len(line) + 1
+            if size >= threshold:
+                yield from ((text, True) for text, _ in held)
+                held = []
+    yield from held
+
+
+# Distinct templates remembered by mark_template_lines, oldest dropped first
+TEMPLATE_CACHE = 1024
+
+
+def changed_span(line, copy):
+    # True when line equals copy, otherwise the (start, end) span of line
+    # that differs, e.g. just the number in a renamed function
+    if line == copy:
+        return True
+    start = len(os.path.commonprefix([line, copy]))
+    end = len(line) - len(os.path.commonprefix([line[::-1], copy[::-1]]))
+    return start, max(start, end)
+
+
+def mark_template_lines(marked, cache_size=TEMPLATE_CACHE):
+    # Takes (line, pasted) pairs and also marks for pasting what a blank-line
+    # separated block shares with the first block of its template (the same
+    # text up to its numbers): the lines it repeats word for word, and the
+    # text around what changed in the rest, e.g. all of a renamed signature
+    # but the number. Only that changed part is typed again
+    seen = {}
+    block = []
+    for line, pasted in itertools.chain(marked, [(None, False)]):
+        if line is not None and line.strip() and len(block) < BLOCK_LINES:
+            block.append((line, pasted))
+            continue
+        if block:
+            lines = [text for text, _ in block]
+            template = re.sub(r'\d+', '#', '\n'.join(lines))
+            first = seen.get(template)
+            if first is None:
+                seen[template] = lines
+                if len(seen) > cache_size:
+                    del seen[next(iter(seen))]
+                yield from block
+            else:
+                for (text, pasted), copy in zip(block, first):
+                    yield text, pasted or changed_span(text, copy)
+            block = []
+        if line is not None:
+            yield line, pasted
+
+
+# What the keystroke planner assumes the editor does, after VS Code's defaults
+# for JavaScript/JSX. Brackets and quotes auto-close when the next character is
+# one of these (or the line ends); quotes not inside a string or after a word
+AUTO_CLOSE = {'(': ')', '[': ']', '{': '}', "'": "'", '"': '"', '`': '`'}
+AUTO_CLOSE_BEFORE = ';:.,=}])> \t'
+WORD_SEPARATORS = '`~!@#$%^&*()-=+[{]}\\|;:\'",.<>/?'
+# Enter indents one more level after a line that leaves a bracket open...
+INCREASE_INDENT = re.compile(r'''^((?!//).)*(\{([^}"'`/]*|(\t| )*//.*)|\([^)"'`/]*|\[[^\]"'`/]*)$''')
+# ...or ends in an opening JSX tag
+OPEN_TAG_END = re.compile(r'<(?!(?:area|base|br|col|embed|hr|img|input|keygen|link|menuitem|meta|param|source|track|wbr)\b)'
+                          r'([_:\w][_:\w.\d-]*)([^/>]*(?!/)>)[^<]*$', re.IGNORECASE)
+
+
+def scan_code(text):
+    # (open quote or None, inside a // comment) at the end of text
+    quote = None
+    i = 0
+    while i < len(text):
+        char = text[i]
+        if quote:
+            if char == '\\':
+                i += 1
+            elif char == quote:
+                quote = None
+        elif char in '\'"`':
+            quote = char
+        elif text.startswith('//', i):
+            return None, True
+        i += 1
+    return quote, False
+
+
+def open_tag(text):
+    # Name of the JSX tag a '>' typed after text would close, if any: the last
+    # '<' starting a tag name, with no quotes or braces left open since
+    match = None
+    for match in re.finditer(r'(?<![\w)\]])<([A-Za-z][\w.:-]*)?', text):
+        pass
+    if match is None:
+        return None
+    rest = text[match.end():]
+    if match.group(1) is None:
+        return '' if not rest else None  # only <> opens a fragment
+    if rest.endswith('/') or scan_code(rest)[0] or rest.count('{') != rest.count('}') or '>' in rest.replace('=>', ''):
+        return None
+    return match.group(1)
+
+
+def indent_of(line):
+    return len(line) - len(line.lstrip(' '))
+
+
+class EditorModel:
+    # The editor as the keystroke planner sees it: the line under the cursor
+    # (with the columns of auto-inserted closers, which typing over replaces),
+    # lines an Enter pushed below the cursor, and the brackets still open in
+    # the lines above, for the outdent when a line starts with } or ]
+    def __init__(self, indent_size=4):
+        self.indent_size = indent_size
+        self.row = ''
+        self.col = 0
+        self.auto = set()
+        self.below = []
+        self.opened = []
+
+    def insert(self, text, auto=False):
+        self.auto = {c + len(text) if c >= self.col else c for c in self.auto}
+        if auto:
+            self.auto.add(self.col)
+        self.row = self.row[:self.col] + text + self.row[self.col:]
+
+    def set_indent(self, width):
+        old = indent_of(self.row)
+        shift = width - old
+        self.row = ' ' * width + self.row[old:]
+        self.col += shift
+        self.auto = {c + shift for c in self.auto}
+
+    def type(self, char):
+        before = self.row[:self.col]
+        after = self.row[self.col:self.col + 1]
+        if after == char and self.col in self.auto:
+            self.auto.discard(self.col)
+            self.col += 1
+            return
+        if char in '}]' and not before.strip() and self.opened:
+            self.set_indent(self.opened[-1][1])
+            before = self.row[:self.col]
+        if char == '\t':
+            char = ' ' * (self.indent_size - self.col % self.indent_size)
+        self.insert(char)
+        self.col += len(char)
+        quote, comment = scan_code(before)
+        if char in AUTO_CLOSE and (not after or after in AUTO_CLOSE_BEFORE):
+            if char in '([{' or not (quote or comment or (before and before[-1] not in WORD_SEPARATORS
+                                                         and not before[-1].isspace())):
+                self.insert(AUTO_CLOSE[char], auto=True)
+        elif char == '>' and not quote and not comment:
+            name = open_tag(before)
+            if name is not None:
+                self.insert(f'</{name}>')
+
+    def leave(self):
+        # The line is final: trim an auto-indent nobody typed after, and keep
+        # its open brackets for later outdents
+        if not self.row.strip():
+            self.row = ''
+        indent = indent_of(self.row)
+        quote = None
+        code = self.row
+        i = 0
+        while i < len(code):
+            char = code[i]
+            if quote:
+                if char == '\\':
+                    i += 1
+                elif char == quote:
+                    quote = None
+            elif char in '\'"`':
+                quote = char
+            elif code.startswith('//', i):
+                break
+            elif char in '([{':
+                self.opened.append((char, indent))
+            elif char in ')]}' and self.opened:
+                self.opened.pop()
+            i += 1
+        line = self.row
+        self.row, self.col, self.auto = '', 0, set()
+        return line
+
+    def enter(self):
+        before, rest = self.row[:self.col], self.row[self.col:]
+        indent = indent_of(before) if before.strip() else len(before)
+        self.row = before
+        self.leave()
+        step = self.indent_size
+        if rest and before and (AUTO_CLOSE.get(before[-1]) == rest[0] and before[-1] in '([{'
+                                or before.endswith('>') and rest.startswith('</')):
+            self.below.insert(0, ' ' * indent + rest)
+            rest = ''
+        elif not (INCREASE_INDENT.match(before) or OPEN_TAG_END.search(before)):
+            step = 0
+        self.row = ' ' * (indent + step) + rest
+        self.col = indent + step
+
+    def press(self, char):
+        if char == '\n':
+            self.enter()
+        elif char == NEXT_LINE:
+            self.leave()
+            self.row = self.below.pop(0)
+            self.col = len(self.row)
+        elif char == END_KEY:
+            self.col = len(self.row)
+        elif char == HOME_KEY:
+            self.col = indent_of(self.row)
+        elif char == DELETE_KEY:
+            self.row = self.row[:self.col] + self.row[self.col + 1:]
+            self.auto = {c - 1 if c > self.col else c for c in self.auto if c != self.col}
+        elif char == BACKSPACE_KEY:
+            # Inside the indentation this goes back to the previous tab stop
+            width = self.col % self.indent_size or self.indent_size
+            self.row = self.row[:self.col - width] + self.row[self.col:]
+            self.col -= width
+        elif char == DELETE_TO_END:
+            self.row = self.row[:self.col]
+            self.auto = {c for c in self.auto if c < self.col}
+        elif char == DELETE_ROW_BELOW:
+            self.below.pop(0)
+        else:
+            self.type(char)
+
+
+class KeystrokePlanner:
+    # Turns each payload line into the fewest keys that leave exactly that line
+    # in an editor behaving like EditorModel: no indentation the editor adds
+    # itself, no closers it already inserted, Down+End onto a closing line an
+    # Enter already pushed down. Every planned line is checked against the
+    # model, and report() counts the keys and (mean) seconds saved
+    def __init__(self, indent_size=4):
+        self.indent_size = indent_size
+        self.literal_keys = self.planned_keys = self.pauses_saved = 0
+
+    def indent_keys(self, width, target):
+        # Backspace drops to the previous tab stop, Tab rises to the next one
+        keys = ''
+        while width > target:
+            width -= width % self.indent_size or self.indent_size
+            keys += BACKSPACE_KEY
+        while width - width % self.indent_size + self.indent_size <= target:
+            width += self.indent_size - width % self.indent_size
+            keys += '\t'
+        return keys + ' ' * (target - width)
+
+    def plan_line(self, model, line, following, next_code):
+        keys = []
+
+        def press(char):
+            keys.append(char)
+            model.press(char)
+
+        def type_char(char):
+            press(char)
+            if model.row[:model.col] != line[:model.col]:
+                # A closer outdented the line somewhere else: fix it from Home
+                press(HOME_KEY)
+                for key in self.indent_keys(model.col, target):
+                    press(key)
+                press(END_KEY)
+
+        if '\t' in line:
+            raise ValueError("The keystroke planner indents with spaces; the payload has tab characters")
+        target = indent_of(line)
+        if line.strip() and not model.row.strip():
+            if line[target] in '}]':
+                type_char(line[target])  # the editor re-indents the line for this
+            else:
+                for char in self.indent_keys(model.col, target):
+                    press(char)
+
+        while model.col < len(line):
+            after = model.row[model.col:]
+            rest = line[model.col:]
+            # Jump over text the editor already put there, or type (over
+            # an auto-inserted closer, if that is what comes next)
+            if len(after) > 1 and rest.startswith(after):
+                press(END_KEY)
+            else:
+                type_char(rest[0])
+
+        # Whatever the editor closed on this line but the payload didn't: let
+        # Enter push it onto its own line when the block below has a body,
+        # otherwise delete it
+        rest = model.row[model.col:]
+        expand = (rest and next_code is not None and indent_of(next_code) > indent_of(line)
+                  and (AUTO_CLOSE.get(line[-1:]) == rest[0] and line[-1:] in '([{'
+                       or line.endswith('>') and rest.startswith('</')))
+        if rest and not expand:
+            press(DELETE_KEY if len(rest) == 1 else DELETE_TO_END)
+        while model.below and not expand:
+            below = model.below[0]
+            if following is not None and following.strip() and following.startswith(below):
+                self.finish(model, line, keys + [NEXT_LINE])
+                return ''.join(keys) + NEXT_LINE
+            if next_code is not None and indent_of(next_code) >= indent_of(below) and (
+                    indent_of(next_code) > indent_of(below) or next_code.startswith(below)):
+                break
+            press(DELETE_ROW_BELOW)
+
+        self.finish(model, line, keys + ['\n'])
+        return ''.join(keys)
+
+    def finish(self, model, line, keys):
+        # Checks the line came out as planned (a blank line's auto-indent gets
+        # trimmed), sends its line end and counts the keys
+        typed = model.row[:model.col] if model.row.strip() else ''
+        if typed != line:
+            raise ValueError(f"Planned keys leave {typed!r} instead of {line!r}")
+        model.press(keys[-1])
+        self.literal_keys += len(line) + 1
+        self.planned_keys += sum(len(EDIT_KEYS.get(char, '.')) for char in keys)
+        self.pauses_saved += sum(line.count(char) - keys.count(char) for char in PAUSE_CHARS)
+
+    def plan(self, lines):
+        # Yields (line, keys) per payload line; a line's keys leave out its
+        # newline unless they end in NEXT_LINE. Looks ahead to the next
+        # non-blank line only, so memory stays flat. The editor trims a line
+        # holding only whitespace once the cursor leaves it, so such lines
+        # come out (and are yielded) empty
+        self.literal_keys = self.planned_keys = self.pauses_saved = 0
+        model = EditorModel(self.indent_size)
+        held = []
+        for line in itertools.chain(lines, [None]):
+            if line is not None:
+                if not line.strip():
+                    held.append('')
+                    continue
+                held.append(line)
+            for index, previous in enumerate(held[:-1] if line is not None else held):
+                following = held[index + 1] if index + 1 < len(held) else None
+                yield previous, self.plan_line(model, previous, following, line)
+            held = held[-1:] if line is not None else []
+
+    def report(self):
+        # Means of the schedule's draws: 0.6 s per key, 2 s per pause
+        keys_saved = self.literal_keys - self.planned_keys
+        return {
+            'literal_keys': self.literal_keys,
+            'planned_keys': self.planned_keys,
+            'keys_saved': keys_saved,
+            'seconds_saved': keys_saved * 0.6 + self.pauses_saved * 2.0,
+        }
+
+
+def typed_lines(payload, paste_regions=(), paste_threshold=None, planner=None, templates=False):
+    # (line, pasted) pairs to compile, or (line, pasted, keys) when a planner
+    # decides the keys for each line
+    if planner is not None:
+        return ((line, False, keys) for line, keys in planner.plan(payload.lines()))
+    marked = mark_paste_lines(payload.lines(), paste_regions, paste_threshold)
+    return mark_template_lines(marked) if templates else marked
+
+
+class Schedule:
+    # Every delay of a run, drawn up front so the typing loop only walks arrays.
+    # Chunk c covers text[chunk_start[c]:chunk_end[c]]; line i owns the chunks
+    # before line_chunk_end[i]. chunk_gap[c] is the single wait after chunk c:
+    # its last key's interval plus any pause-character pause. paste flags the
+    # wholly pasted lines and chunk_paste every pasted chunk. lines are the
+    # payload lines, which differ from the text when keystrokes were planned
+    def __init__(self, text, chunk_start, chunk_end, chunk_interval, chunk_pause,
+                 line_chunk_end, line_pause, save, save_settle, final_settle, paste, chunk_paste, lines):
+        self.text = text
+        self.lines = lines
+        self.chunk_start = chunk_start
+        self.chunk_end = chunk_end
+        self.chunk_interval = chunk_interval
+        self.chunk_pause = chunk_pause
+        self.chunk_gap = chunk_interval + chunk_pause
+        self.line_chunk_end = line_chunk_end
+        self.line_pause = line_pause
+        self.save = save
+        self.save_settle = save_settle
+        self.final_settle = final_settle
+        self.paste = paste
+        self.chunk_paste = chunk_paste
+
+    @property
+    def line_count(self):
+        return len(self.line_pause)
+
+    @property
+    def save_count(self):
+        return int(self.save.sum()) + 1
+
+    def line_seconds(self, overlap_saves=False):
+        # Planned seconds per line: its keys and pauses, line pause and save.
+        # An overlapped save settles inside the line pause instead of after it
+        if not self.line_count:
+            return np.zeros(0)
+        chunk_seconds = (self.chunk_end - self.chunk_start) * self.chunk_interval + self.chunk_pause
+        line_start = np.concatenate(([0], self.line_chunk_end[:-1]))
+        settle = self.save * self.save_settle
+        gap = np.maximum(self.line_pause, settle) if overlap_saves else self.line_pause + settle
+        return np.add.reduceat(chunk_seconds, line_start) + gap
+
+    def planned_seconds(self, overlap_saves=False):
+        return float(self.line_seconds(overlap_saves).sum() + self.final_settle)
+
+
+def compile_schedule(lines, chunk_size=CHUNK_SIZE, seed=None, paste=None, keys=None):
+    # paste holds per line True (paste it all), False (type it) or a (start,
+    # end) span where only line[start:end] is typed and the rest pasted. keys,
+    # when given, are what to type for each line instead of the line itself;
+    # a line's keys end in NEXT_LINE or get the usual newline
+    rng = np.random.default_rng(seed)
+    if keys is None:
+        text = ''.join(line + '\n' for line in lines)
+        line_ends = [ord('\n')]
+    else:
+        text = ''.join(line if line.endswith(NEXT_LINE) else line + '\n' for line in keys)
+        line_ends = [ord('\n'), ord(NEXT_LINE)]
+    codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+    index = np.arange(len(codes))
+
+    # Which characters go in by paste rather than being typed
+    is_newline = np.isin(codes, line_ends)
+    line_end_at = np.flatnonzero(is_newline)
+    line_length = np.diff(line_end_at, prepend=-1)
+    n_lines = len(lines)
+    paste = [False] * n_lines if paste is None else paste
+    full = np.array([span is True for span in paste], dtype=bool)
+    pasted = np.repeat(full, line_length)
+    for number, span in enumerate(paste):
+        if isinstance(span, tuple):
+            begin = line_end_at[number] - line_length[number] + 1
+            pasted[begin:begin + line_length[number]] = True
+            pasted[begin + span[0]:begin + span[1]] = False
+
+    # Pause characters, newlines and switches between typing and pasting
+    # always close a run; otherwise a run is cut every chunk_size characters
+    # counted from the previous hard break
+    is_pause = np.isin(codes, [ord(char) for char in PAUSE_CHARS])
+    hard = is_pause | is_newline
+    hard[:-1] |= pasted[:-1] != pasted[1:]
+    last_hard = np.maximum.accumulate(np.where(hard, index, -1))
+    previous_hard = np.concatenate(([-1], last_hard[:-1]))
+    full_run = (index - previous_hard) % chunk_size == 0
+    chunk_end = np.flatnonzero(hard | full_run) + 1
+    chunk_start = np.zeros_like(chunk_end)
+    chunk_start[1:] = chunk_end[:-1]
+
+    n_chunks = len(chunk_end)
+    chunk_interval = rng.uniform(0.4, 0.8, n_chunks)
+    chunk_pause = np.where(is_pause[chunk_end - 1], rng.uniform(1.5, 2.5, n_chunks), 0.0)
+    line_chunk_end = np.searchsorted(chunk_end, line_end_at + 1) + 1
+
+    # Line pause, then the save coin flip (every 3 to 6 lines, randomly)
+    line_pause = rng.uniform(2.5, 5.5, n_lines)
+    save = rng.integers(1, 6, n_lines) == 3
+    save_settle = rng.uniform(0.5, 1.2, n_lines)
+    final_settle = float(rng.uniform(0.5, 1.2))
+
+    # Pasted chunks are drawn like typed ones so the RNG stream stays the
+    # same, then lose their per-key delays. A line whose end is pasted runs on
+    # into the wholly pasted lines after it, and only the last line of such a
+    # run keeps its line pause and save coin flip
+    chunk_paste = pasted[chunk_end - 1]
+    if chunk_paste.any():
+        chunk_interval[chunk_paste] = 0.0
+        chunk_pause[chunk_paste] = 0.0
+        inside = pasted[line_end_at] & np.append(full[1:], False)
+        line_pause[inside] = 0.0
+        save[inside] = False
+
+    return Schedule(text, chunk_start, chunk_end, chunk_interval, chunk_pause,
+                    line_chunk_end, line_pause, save, save_settle, final_settle, full, chunk_paste, lines)
+
+
+def new_seed():
+    return int(np.random.SeedSequence().entropy)
+
+
+def iter_schedules(marked_lines, chunk_size=CHUNK_SIZE, seed=0, first_block=0):
+    # Takes the pairs (or triples, with keys) from typed_lines. Each block draws from
+    # its own (seed, block index) stream, so any block can be rebuilt without
+    # replaying the ones before it
+    marked_lines = iter(marked_lines)
+    for index in itertools.count(first_block):
+        block = list(itertools.islice(marked_lines, BLOCK_LINES))
+        if not block:
+            return
+        lines, paste, *keys = zip(*block)
+        yield compile_schedule(lines, chunk_size, [seed, index], paste, keys[0] if keys else None)
+
+
+class DeadlineScheduler:
+    # Sleeps until absolute deadlines on the monotonic clock instead of chaining
+    # relative sleeps, so oversleep and time spent inside the backend get paid
+    # back by the next wait rather than piling up
+    def __init__(self, clock=time.monotonic_ns, sleep=time.sleep):
+        self.clock = clock
+        self.sleep = sleep
+        self.start_ns = self.deadline_ns = clock()
+        self.drift_ns = 0  # how late the latest wait woke up, i.e. cumulative drift
+        self.max_drift_ns = 0
+        self.waits = 0
+
+    def advance(self, seconds):
+        # Move the deadline without waiting, for time the backend already spent
+        self.deadline_ns += round(seconds * 1e9)
+
+    def wait(self, seconds):
+        self.advance(seconds)
+        remaining = self.deadline_ns - self.clock()
+        if remaining > 0:
+            self.sleep(remaining / 1e9)
+        self.drift_ns = self.clock() - self.deadline_ns
+        self.max_drift_ns = max(self.max_drift_ns, self.drift_ns)
+        self.waits += 1
+
+    def report(self):
+        return {
+            'planned_s': (self.deadline_ns - self.start_ns) / 1e9,
+            'elapsed_s': (self.clock() - self.start_ns) / 1e9,
+            'drift_ms': self.drift_ns / 1e6,
+            'max_drift_ms': self.max_drift_ns / 1e6,
+            'waits': self.waits,
+        }
+
+
+class FailSafeAbort(Exception):
+    pass
+
+
+class FailSafeMonitor:
+    # Polls the pointer on a background thread and sets abort once it sits in
+    # a fail-safe corner. The typing side only ever reads that in-process
+    # event: check() between chunks, and sleep() for every wait, which wakes
+    # early and raises FailSafeAbort as soon as abort is set
+    def __init__(self, rate=FAILSAFE_RATE, position=None, corners=None):
+        self.interval = 1 / rate
+        self.position = position
+        self.corners = corners
+        self.abort = threading.Event()
+        self.stopped = threading.Event()
+        self.thread = None
+        self.error = None
+
+    def start(self):
+        self.abort.clear()
+        self.stopped.clear()
+        self.error = None
+        if self.position is None or self.corners is None:
+            import pyautogui
+
+            self.position = self.position or pyautogui.position
+            self.corners = self.corners or pyautogui.FAILSAFE_POINTS
+        self.corners = {tuple(corner) for corner in self.corners}
+        self.thread = threading.Thread(target=self.poll, name='failsafe', daemon=True)
+        self.thread.start()
+
+    def poll(self):
+        # Fails closed: a pointer that can't be read aborts like a corner
+        while not self.stopped.wait(self.interval):
+            try:
+                position = tuple(self.position())
+            except Exception as exc:
+                self.error = exc
+                self.abort.set()
+                return
+            if position in self.corners:
+                self.abort.set()
+                return
+
+    def stop(self):
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def check(self):
+        if self.abort.is_set():
+            if self.error is not None:
+                raise FailSafeAbort(f"Could not read the pointer position: {self.error}") from self.error
+            raise FailSafeAbort("Pointer moved into a fail-safe corner")
+
+    def sleep(self, seconds):
+        if self.abort.wait(seconds):
+            self.check()
+
+
+class TypingInterrupted(Exception):
+    # Raised once the checkpoint is saved after a fail-safe abort or Ctrl+C
+    def __init__(self, reason, checkpoint):
+        super().__init__(f"Typing interrupted by {reason} at line {checkpoint.line + 1}, column {checkpoint.column + 1}")
+        self.reason = reason
+        self.checkpoint = checkpoint
+
+
+class VirtualClock:
+    # Drop-in for time.monotonic_ns/time.sleep where sleeping only moves the
+    # clock forward, so a run of many hours simulates in well under a second
+    def __init__(self):
+        self.now_ns = 0
+
+    def monotonic_ns(self):
+        return self.now_ns
+
+    def monotonic(self):
+        return self.now_ns / 1e9
+
+    def sleep(self, seconds):
+        self.now_ns += round(seconds * 1e9)
+
+
+def quiet_log(*args, **kwargs):
+    pass
+
+
+class Pacer:
+    # Scales every remaining delay so the run lands on end_ns. Re-solved at each
+    # line from the real time left, so early overruns or backend latency get
+    # made up by the rest of the run
+    def __init__(self, scheduler, duration, block_seconds, final_settle, overlap_saves=False):
+        self.scheduler = scheduler
+        self.overlap_saves = overlap_saves
+        self.end_ns = scheduler.start_ns + round(duration * 1e9)
+        # after[b] = planned seconds of every block after block b, plus the final save
+        totals = np.cumsum([final_settle] + block_seconds[::-1])[::-1]
+        self.after = totals[1:].tolist()
+        self.remaining = [final_settle]
+        self.scale = 1.0
+
+    def start_block(self, index, schedule):
+        # remaining[i] = planned seconds from the start of line i to the end
+        tail = np.cumsum(schedule.line_seconds(self.overlap_saves)[::-1])[::-1] + self.after[index]
+        self.remaining = np.append(tail, self.after[index]).tolist()
+
+    def rescale(self, line):
+        left = (self.end_ns - self.scheduler.clock()) / 1e9
+        self.scale = max(left, 0.0) / self.remaining[line] if self.remaining[line] > 0 else 0.0
+        return self.scale
+
+
+class FixedPace:
+    # Same interface as Pacer for a constant scale; 0.0 turns pacing off
+    def __init__(self, scale):
+        self.scale = scale
+
+    def start_block(self, index, schedule):
+        pass
+
+    def rescale(self, line):
+        return self.scale
+
+
+def plan_blocks(payload, chunk_size, seed, paste_regions=(), paste_threshold=None, overlap_saves=False,
+                planner=None, templates=False):
+    # Planned seconds per block and the final save settle, for pacing
+    block_seconds = []
+    final_settle = 0.0
+    marked = typed_lines(payload, paste_regions, paste_threshold, planner, templates)
+    for schedule in iter_schedules(marked, chunk_size, seed):
+        block_seconds.append(float(schedule.line_seconds(overlap_saves).sum()))
+        final_settle = schedule.final_settle
+    return block_seconds, final_settle
+
+
+class SavePolicy:
+    # Decides at every line end whether to save. Any enabled trigger fires: the
+    # old 1-in-5 coin flip, every_keys characters or every_seconds seconds since
+    # the last save, or a syntactic boundary (an unindented line ending a
+    # statement or block). min_interval then allows at most one save per window.
+    # Also keeps stats on how much typed work was at risk between saves
+    def __init__(self, coin_flip=True, every_keys=None, every_seconds=None, on_boundary=False, min_interval=None):
+        self.coin_flip = coin_flip
+        self.every_keys = every_keys
+        self.every_seconds = every_seconds
+        self.on_boundary = on_boundary
+        self.min_interval = min_interval
+        self.start(0, 0)
+
+    def start(self, chars, now_ns):
+        self.last_chars = chars
+        self.last_ns = now_ns
+        self.saves = 0
+        self.risk_total = 0
+        self.max_chars_at_risk = 0
+        self.max_seconds_at_risk = 0.0
+
+    def is_boundary(self, line):
+        return bool(line) and not line[0].isspace() and line.rstrip()[-1:] in (';', '}', ')')
+
+    def due(self, line, coin, chars, now_ns):
+        seconds = (now_ns - self.last_ns) / 1e9
+        if self.min_interval is not None and seconds < self.min_interval:
+            return False
+        return bool(
+            (self.coin_flip and coin)
+            or (self.every_keys is not None and chars - self.last_chars >= self.every_keys)
+            or (self.every_seconds is not None and seconds >= self.every_seconds)
+            or (self.on_boundary and self.is_boundary(line))
+        )
+
+    def saved(self, chars, now_ns):
+        at_risk = chars - self.last_chars
+        self.saves += 1
+        self.risk_total += at_risk
+        self.max_chars_at_risk = max(self.max_chars_at_risk, at_risk)
+        self.max_seconds_at_risk = max(self.max_seconds_at_risk, (now_ns - self.last_ns) / 1e9)
+        self.last_chars = chars
+        self.last_ns = now_ns
+
+    @property
+    def coin_flip_only(self):
+        # The original policy, a plain 1-in-5 chance per line
+        return self.coin_flip and self.every_keys is None and self.every_seconds is None and not (
+            self.on_boundary or self.min_interval is not None)
+
+    def report(self):
+        return {
+            'saves': self.saves,
+            'mean_chars_at_risk': self.risk_total / self.saves if self.saves else 0.0,
+            'max_chars_at_risk': self.max_chars_at_risk,
+            'max_seconds_at_risk': self.max_seconds_at_risk,
+        }
+
+
+def press_cmd_s(backend, keys, log=print):
+    # Sends the save keys only; the caller decides where the settle time goes.
+    # No save keys in the profile means no save and nothing to wait out
+    if not perform(backend, keys, 'save'):
+        return False
+    log(f"💾 ({describe_keys(keys['save'])}) Save triggered")
+    return True
+
+
+def timed_save(backend, keys, scheduler, metrics=None, log=print):
+    # press_cmd_s, timed against the schedule when metrics are kept
+    if metrics is None:
+        return press_cmd_s(backend, keys, log)
+    metrics.start_send(scheduler.deadline_ns)
+    saved = press_cmd_s(backend, keys, log)
+    metrics.end_send('save', int(saved))
+    return saved
+
+
+def describe_keys(steps):
+    return ', '.join('+'.join(step).title() if isinstance(step, tuple) else repr(step) for step in steps)
+
+
+# Latency histograms are exact below 2**HISTOGRAM_BITS ns, then keep
+# 2**(HISTOGRAM_BITS - 1) linear sub-buckets per power of two, HDR style:
+# every value is held to within 1/64 (1.6%)
+HISTOGRAM_BITS = 7
+
+# Bucket bounds, in seconds, of the exported Prometheus histograms
+PROMETHEUS_BUCKETS = (1e-6, 1e-5, 1e-4, 5e-4, 1e-3, 2.5e-3, 5e-3, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+
+
+class LatencyHistogram:
+    # Nanosecond values in log-linear buckets: exact below 2**HISTOGRAM_BITS,
+    # then 2**(HISTOGRAM_BITS - 1) buckets per doubling. Negative values
+    # count as 0
+    def __init__(self):
+        self.counts = {}
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    @staticmethod
+    def bucket(value):
+        shift = value.bit_length() - HISTOGRAM_BITS
+        if shift <= 0:
+            return value
+        return (shift << (HISTOGRAM_BITS - 1)) + (value >> shift)
+
+    @staticmethod
+    def bucket_bounds(index):
+        # The (lowest, highest) value that lands in a bucket
+        half = 1 << (HISTOGRAM_BITS - 1)
+        if index < 2 * half:
+            return index, index
+        shift = index // half - 1
+        low = (index % half + half) << shift
+        return low, low + (1 << shift) - 1
+
+    def record(self, value, count=1):
+        value = max(int(value), 0)
+        index = self.bucket(value)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.count += count
+        self.total += value * count
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = max(self.max, value)
+
+    def percentile(self, q):
+        if not self.count:
+            return 0
+        rank = q / 100 * self.count
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(self.bucket_bounds(index)[1], self.max)
+        return self.max
+
+    def cumulative(self, bounds_ns):
+        # Values at or below each bound, counting a bucket once all of it is
+        indexes = sorted(self.counts)
+        highest = np.array([self.bucket_bounds(index)[1] for index in indexes], dtype=np.int64)
+        totals = np.cumsum([self.counts[index] for index in indexes])
+        at = np.searchsorted(highest, bounds_ns, side='right')
+        return [int(totals[i - 1]) if i else 0 for i in at]
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'min_us': (self.min or 0) / 1e3,
+            'mean_us': self.total / self.count / 1e3 if self.count else 0.0,
+            'p50_us': self.percentile(50) / 1e3,
+            'p90_us': self.percentile(90) / 1e3,
+            'p99_us': self.percentile(99) / 1e3,
+            'p999_us': self.percentile(99.9) / 1e3,
+            'max_us': self.max / 1e3,
+        }
+
+
+class RunMetrics:
+    # Times every key, paste and save a run sends against the schedule: its
+    # planned and actual send time (lateness), how long the backend call took
+    # (send), and how far each sleep overran (oversleep). The backend's and
+    # scheduler's sleeps are wrapped while attached, so the keys of one chunk
+    # are split at the sleeps between them; a backend that sends a chunk with
+    # at most one sleep (file, null) has its keys share the call evenly.
+    # Collects over every run it is passed to
+    kinds = ('key', 'paste', 'save')
+
+    def __init__(self):
+        self.lateness = {kind: LatencyHistogram() for kind in self.kinds}
+        self.send = {kind: LatencyHistogram() for kind in self.kinds}
+        self.oversleep = LatencyHistogram()
+        self.sends = dict.fromkeys(self.kinds, 0)
+        self.chars = 0
+        self.elapsed_ns = 0
+        self.clock = None
+        self.marks = None
+        self.wrapped = []
+
+    def attach(self, backend, scheduler):
+        self.clock = scheduler.clock
+        self.started_ns = self.clock()
+        for owner in (backend, scheduler):
+            sleep = getattr(owner, 'sleep', None)
+            if sleep is not None:
+                self.wrapped.append((owner, sleep))
+                owner.sleep = self.timed_sleep(sleep)
+
+    def detach(self):
+        for owner, sleep in self.wrapped:
+            owner.sleep = sleep
+        self.wrapped = []
+        if self.clock is not None:
+            self.elapsed_ns += self.clock() - self.started_ns
+            self.clock = None
+
+    def timed_sleep(self, sleep):
+        def timed(seconds):
+            start = self.clock()
+            sleep(seconds)
+            end = self.clock()
+            self.oversleep.record(end - start - round(seconds * 1e9))
+            if self.marks is not None:
+                self.marks += (start, end)
+        return timed
+
+    def start_send(self, planned_ns, interval=0.0):
+        self.planned_ns = planned_ns
+        self.interval_ns = round(interval * 1e9)
+        self.marks = [self.clock()]
+
+    def end_send(self, kind, keys, chars=0):
+        # keys is how many keys (or pastes, or saves) the call sent; 0 drops it
+        marks = self.marks
+        self.marks = None
+        if not keys:
+            return
+        marks.append(self.clock())
+        self.sends[kind] += keys
+        self.chars += chars
+        segments = list(zip(marks[::2], marks[1::2]))
+        if len(segments) == keys:
+            for k, (start, end) in enumerate(segments):
+                self.lateness[kind].record(start - (self.planned_ns + k * self.interval_ns))
+                self.send[kind].record(end - start)
+        else:
+            sending = sum(end - start for start, end in segments)
+            self.lateness[kind].record(marks[0] - self.planned_ns, keys)
+            self.send[kind].record(sending // keys, keys)
+
+    def summary(self):
+        elapsed_s = self.elapsed_ns / 1e9
+        report = {
+            'keys': self.sends['key'],
+            'pastes': self.sends['paste'],
+            'saves': self.sends['save'],
+            'chars': self.chars,
+            'elapsed_s': elapsed_s,
+            'keys_per_s': self.sends['key'] / elapsed_s if elapsed_s else 0.0,
+            'chars_per_s': self.chars / elapsed_s if elapsed_s else 0.0,
+            'oversleep': self.oversleep.summary(),
+        }
+        for kind in self.kinds:
+            report[f'{kind}_lateness'] = self.lateness[kind].summary()
+            report[f'{kind}_send'] = self.send[kind].summary()
+        return report
+
+    def prometheus(self, prefix='typer'):
+        # Prometheus text exposition format
+        out = []
+
+        def metric(name, kind, help_text):
+            out.append(f"# HELP {prefix}_{name} {help_text}")
+            out.append(f"# TYPE {prefix}_{name} {kind}")
+
+        def histogram(name, hist, labels=''):
+            bounds_ns = [round(bound * 1e9) for bound in PROMETHEUS_BUCKETS]
+            for bound, count in zip(PROMETHEUS_BUCKETS, hist.cumulative(bounds_ns)):
+                out.append(f'{prefix}_{name}_bucket{{{labels}le="{bound:g}"}} {count}')
+            out.append(f'{prefix}_{name}_bucket{{{labels}le="+Inf"}} {hist.count}')
+            label_set = f'{{{labels.rstrip(",")}}}' if labels else ''
+            out.append(f'{prefix}_{name}_sum{label_set} {hist.total / 1e9:.9f}')
+            out.append(f'{prefix}_{name}_count{label_set} {hist.count}')
+
+        metric('sends_total', 'counter', "Keys, pastes and saves sent to the backend")
+        for kind in self.kinds:
+            out.append(f'{prefix}_sends_total{{kind="{kind}"}} {self.sends[kind]}')
+        metric('chars_total', 'counter', "Characters typed or pasted")
+        out.append(f'{prefix}_chars_total {self.chars}')
+        metric('run_seconds_total', 'counter', "Time spent in runs")
+        out.append(f'{prefix}_run_seconds_total {self.elapsed_ns / 1e9:.9f}')
+        metric('lateness_seconds', 'histogram', "Actual minus planned send time")
+        for kind in self.kinds:
+            histogram('lateness_seconds', self.lateness[kind], f'kind="{kind}",')
+        metric('send_seconds', 'histogram', "Backend time to send one key, paste or save")
+        for kind in self.kinds:
+            histogram('send_seconds', self.send[kind], f'kind="{kind}",')
+        metric('oversleep_seconds', 'histogram', "How far each sleep overran what was asked")
+        histogram('oversleep_seconds', self.oversleep)
+        return '\n'.join(out) + '\n'
+
+    def write(self, json_path=None, prometheus_path=None):
+        if json_path is not None:
+            with open(json_path, 'w') as f:
+                json.dump(self.summary(), f, indent=2)
+        if prometheus_path is not None:
+            with open(prometheus_path, 'w') as f:
+                f.write(self.prometheus())
+
+
+def line_layout(payload, paste_regions=(), paste_threshold=None, planner=None, templates=False):
+    # The payload and options that decide what each line's chunks are, as
+    # JSON. Text, stdin and plain iterables can't be identified, so they
+    # record None and the caller vouches for them on resume
+    if payload.path is not None:
+        identity = os.path.abspath(payload.path)
+    elif isinstance(payload.source, SyntheticPayload):
+        identity = repr(payload.source)
+    else:
+        identity = None
+    return {
+        'payload': identity,
+        'paste_regions': [list(region) for region in paste_regions],
+        'paste_threshold': paste_threshold,
+        'templates': bool(templates),
+        'plan_indent': planner.indent_size if planner is not None else None,
+    }
+
+
+class Checkpoint:
+    # Where a run stands: the next line, the column inside it and the chars
+    # typed so far. Blocks are seeded from (seed, block index), so the seed and
+    # block size are the whole RNG state needed to rebuild the remaining draws,
+    # given the same line layout (pastes, templates, keystroke planning).
+    # Written atomically after lines (at most every min_interval seconds
+    # unless the editor just saved) and once more on interruption
+    def __init__(self, path=None, seed=0, chunk_size=CHUNK_SIZE, source=None, line=0, column=0, chars=0,
+                 layout=None):
+        self.path = path
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self.source = source
+        self.line = line
+        self.column = column
+        self.chars = chars
+        self.layout = layout
+        self.saved_at = None
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            state = json.load(f)
+        if state['block_lines'] != BLOCK_LINES:
+            raise ValueError(f"Checkpoint was written with {state['block_lines']} lines per block, not {BLOCK_LINES}")
+        return cls(path, state['seed'], state['chunk_size'], state['source'],
+                   state['line'], state['column'], state['chars'], state.get('layout'))
+
+    def check_layout(self, layout):
+        # Resuming under other layout options would rebuild different chunks
+        if self.layout is None or self.layout == layout:
+            return
+        changed = ', '.join(f"{name}={value!r}" for name, value in self.layout.items() if layout[name] != value)
+        raise ValueError(f"Checkpoint was written with {changed}; resume with the same options")
+
+    def save(self, min_interval=0):
+        if self.path is None:
+            return
+        now = time.monotonic()
+        if min_interval and self.saved_at is not None and now - self.saved_at < min_interval:
+            return
+        self.saved_at = now
+        state = {
+            'seed': self.seed,
+            'chunk_size': self.chunk_size,
+            'block_lines': BLOCK_LINES,
+            'source': self.source,
+            'line': self.line,
+            'column': self.column,
+            'chars': self.chars,
+            'layout': self.layout,
+        }
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+
+    def clear(self):
+        if self.path is not None and os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def type_schedule(schedule, backend, scheduler, checkpoint, keys, save_policy, pacer=None, log=print,
+                  on_line=None, line_offset=0, start_line=0, start_column=0, overlap_saves=True, failsafe=None,
+                  metrics=None):
+    payload = schedule.text
+    chunk_start = schedule.chunk_start.tolist()
+    chunk_end = schedule.chunk_end.tolist()
+    chunk_interval = schedule.chunk_interval.tolist()
+    chunk_gap = schedule.chunk_gap.tolist()
+    chunk_paste = schedule.chunk_paste.tolist()
+    paste = schedule.paste.tolist()
+    scale = 1.0
+
+    first = int(schedule.line_chunk_end[start_line - 1]) if start_line else 0
+    skip = 0
+    i = start_line
+    while i < schedule.line_count:
+        if pacer is not None:
+            scale = pacer.rescale(i)
+
+        line_start = chunk_start[first]
+        if i == start_line and start_column:
+            # Resume inside a line, possibly partway through a chunk that was
+            # interrupted between two keys: skip the keys it already sent
+            position = line_start + start_column
+            first = bisect.bisect_right(chunk_start, position, first) - 1
+            skip = position - chunk_start[first]
+            if position >= chunk_end[first]:
+                first += 1
+                skip = 0
+
+        # Consecutive pasted chunks go in as one paste. One that reaches the end
+        # of the line takes the wholly pasted lines after it along, and the run
+        # ends on the last of them. pending is the gap after the line's last
+        # key, folded into the line pause
+        end_line = i
+        pending = 0.0
+        last = int(schedule.line_chunk_end[i])
+        c = first
+        while c < last:
+            if failsafe is not None:
+                failsafe.check()
+            if chunk_paste[c]:
+                end = c + 1
+                while end < last and chunk_paste[end]:
+                    end += 1
+                if end == last:
+                    while end_line + 1 < schedule.line_count and paste[end_line + 1]:
+                        end_line += 1
+                    last = end = int(schedule.line_chunk_end[end_line])
+                text = payload[chunk_start[c]:chunk_end[end - 1]]
+                if metrics is not None:
+                    metrics.start_send(scheduler.deadline_ns)
+                if keys['paste']:
+                    backend.paste(text, keys['paste'])
+                else:
+                    backend.type_text(text)
+                if metrics is not None:
+                    metrics.end_send('paste', 1, len(text))
+                checkpoint.chars += chunk_end[end - 1] - chunk_start[c]
+                if end == last:
+                    checkpoint.line, checkpoint.column = line_offset + end_line + 1, 0
+                else:
+                    checkpoint.column = chunk_end[end - 1] - line_start
+                pending = 0.0
+                c = end
+                continue
+            interval = chunk_interval[c] * scale
+            begin = chunk_start[c] + skip
+            skip = 0
+            if metrics is not None:
+                metrics.start_send(scheduler.deadline_ns, interval)
+            try:
+                backend.type_text(payload[begin:chunk_end[c]], interval=interval)
+            except (FailSafeAbort, KeyboardInterrupt):
+                # Keys sent before the interrupt stay typed, so the resume
+                # starts right after them
+                sent = getattr(backend, 'sent', 0)
+                checkpoint.column = begin + sent - line_start
+                checkpoint.chars += sent
+                raise
+            if metrics is not None:
+                metrics.end_send('key', chunk_end[c] - begin, chunk_end[c] - begin)
+            checkpoint.column = chunk_end[c] - line_start
+            checkpoint.chars += chunk_end[c] - begin
+            # The backend sleeps the intervals between keys itself; the gap
+            # after the last key and any pause after it are one wait
+            scheduler.advance((chunk_end[c] - begin - 1) * interval)
+            if c < last - 1:
+                scheduler.wait(chunk_gap[c] * scale)
+            else:
+                pending = chunk_gap[c] * scale
+            c += 1
+        first = last
+
+        line_pause = schedule.line_pause[end_line] * scale
+        settle = schedule.save_settle[end_line] * scale
+        now_ns = scheduler.clock()
+        saving = save_policy.due(schedule.lines[end_line], schedule.save[end_line], checkpoint.chars, now_ns)
+
+        if overlap_saves:
+            # Save as the line pause starts, so the settle happens inside it
+            saved = saving and timed_save(backend, keys, scheduler, metrics, log)
+            scheduler.wait(pending + (max(line_pause, settle) if saved else line_pause))
+        else:
+            scheduler.wait(pending + line_pause)
+            saved = saving and timed_save(backend, keys, scheduler, metrics, log)
+            if saved:
+                scheduler.wait(settle)  # small delay after saving
+        if saved:
+            save_policy.saved(checkpoint.chars, now_ns)
+
+        checkpoint.line = line_offset + end_line + 1
+        checkpoint.column = 0
+        checkpoint.save(0 if saved else CHECKPOINT_INTERVAL)
+
+        if on_line is not None:
+            for line in range(i, end_line + 1):
+                on_line(line_offset + line, scheduler.clock() - scheduler.start_ns)
+        i = end_line + 1
+
+
+def hyper_slow_typing_with_saves(source=None, backend=None, chunk_size=CHUNK_SIZE, seed=None, scheduler=None,
+                                 log=print, on_line=None, target_duration=None, finish_at=None,
+                                 checkpoint_path=None, resume=False, pacing=True,
+                                 paste_regions=(), paste_threshold=None, profile=None, save_policy=None,
+                                 overlap_saves=True, failsafe=None, speed=1.0, planner=None, templates=False,
+                                 metrics=None):
+    if resume:
+        # The checkpoint pins the seed and chunking so the remaining draws match
+        checkpoint = Checkpoint.load(checkpoint_path)
+        seed = checkpoint.seed
+        chunk_size = checkpoint.chunk_size
+        if source is None:
+            source = checkpoint.source
+        if source is None:
+            raise ValueError(f"Checkpoint {checkpoint_path} records no payload file; pass the payload it was typing")
+    payload = open_payload(source)
+    layout = line_layout(payload, paste_regions, paste_threshold, planner, templates)
+    if resume:
+        checkpoint.check_layout(layout)
+    else:
+        if seed is None:
+            seed = new_seed()
+        checkpoint = Checkpoint(checkpoint_path, seed, chunk_size, payload.path, layout=layout)
+    if backend is None:
+        # Driving the real desktop: the backend watches the pointer
+        backend = PyAutoGUIBackend(failsafe=failsafe)
+    if failsafe is None:
+        failsafe = getattr(backend, 'failsafe', None)
+    if scheduler is None:
+        scheduler = DeadlineScheduler(sleep=failsafe.sleep if failsafe else time.sleep)
+    failsafe = failsafe or None
+    profile = profile or backend.profile or detect_profile()
+    if profile not in KEY_PROFILES:
+        raise ValueError(f"Unknown key profile {profile!r}; pick one of {', '.join(KEY_PROFILES)}")
+    keys = KEY_PROFILES[profile]
+    if planner is not None:
+        if not profile.startswith('vscode-'):
+            raise ValueError(f"Keystroke planning models VS Code's auto-indent and auto-close, "
+                             f"not the {profile} profile")
+        if paste_regions or paste_threshold is not None or templates:
+            raise ValueError("Keystroke planning and clipboard pastes can't be combined")
+        if payload.rereadable:
+            # Walk the plan once up front, so a payload the model can't
+            # reproduce fails before the first key rather than halfway in
+            for _ in copy.copy(planner).plan(payload.lines()):
+                pass
+    if save_policy is None:
+        save_policy = SavePolicy()
+
+    pacer = None
+    if not pacing:
+        if target_duration is not None or finish_at is not None:
+            raise ValueError("A target duration needs pacing on")
+        pacer = FixedPace(0.0)
+    elif speed != 1.0:
+        if target_duration is not None or finish_at is not None:
+            raise ValueError("Pick either a speed or a target duration, not both")
+        pacer = FixedPace(1 / speed)
+    elif target_duration is not None or finish_at is not None:
+        if not payload.rereadable:
+            raise ValueError("Deadline pacing needs a payload that can be read twice (not stdin or an iterator)")
+        block_seconds, final_settle = plan_blocks(payload, chunk_size, seed, paste_regions, paste_threshold,
+                                                  overlap_saves, planner, templates)
+        # A wall-clock finish time is just a duration measured from the start
+        if finish_at is not None:
+            target_duration = finish_at - time.time() + (scheduler.clock() - scheduler.start_ns) / 1e9
+        pacer = Pacer(scheduler, target_duration, block_seconds, final_settle, overlap_saves)
 
-            # Periodically save (every 3 to 6 lines, randomly)
-            if random.randint(1, 5) == 3:
-                press_cmd_s()
+    try:
+        if failsafe is not None:
+            failsafe.start()
+        if metrics is not None:
+            metrics.attach(backend, scheduler)
+        if checkpoint.line or checkpoint.column:
+            log(f"↩️ Resuming at line {checkpoint.line + 1}, column {checkpoint.column + 1}.")
+        log(f"🎹 Key profile: {profile}")
+        if pacing:
+            log("⌨️ Typing starts in 5 seconds. Focus VS Code and move mouse to top-left to cancel.")
+            scheduler.wait(START_DELAY)
+        backend.begin(checkpoint.chars)
+        save_policy.start(checkpoint.chars, scheduler.clock())
+
+        # Skip to the start of the block holding the resume line
+        first_block, start_line = divmod(checkpoint.line, BLOCK_LINES)
+        start_column = checkpoint.column
+        lines = typed_lines(payload, paste_regions, paste_threshold, planner, templates)
+        next(itertools.islice(lines, first_block * BLOCK_LINES, first_block * BLOCK_LINES), None)
+
+        line_offset = first_block * BLOCK_LINES
+        final_settle = 0.0
+        for index, schedule in enumerate(iter_schedules(lines, chunk_size, seed, first_block), first_block):
+            if pacer is not None:
+                pacer.start_block(index, schedule)
+            type_schedule(schedule, backend, scheduler, checkpoint, keys, save_policy, pacer, log, on_line,
+                          line_offset, start_line, start_column, overlap_saves, failsafe, metrics)
+            line_offset += schedule.line_count
+            final_settle = schedule.final_settle
+            start_line = start_column = 0
 
         # Final save just in case
-        press_cmd_s()
-        print("✅ Finished typing with saves.")
-
-    except pyautogui.FailSafeException:
-        print("❌ Typing interrupted by fail-safe (mouse to top-left).")
-        sys.exit()
-
-    except KeyboardInterrupt:
-        print("❌ Typing manually interrupted (Ctrl+C).")
-        sys.exit()
-
-# Example code to type
-
-
-# Example usage
-code = """
-import React from 'react';
-
-export function utilFunc0_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export const Component1_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export function utilFunc2_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc3_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export const Component4_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export function utilFunc5_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export function utilFunc6_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export function utilFunc7_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export const Component8_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export function utilFunc9_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export function utilFunc10_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export const Component11_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export const Component12_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export function utilFunc13_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export const Component14_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export const Component15_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component16_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export function utilFunc17_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export const Component18_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export const Component19_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export const Component20_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export function utilFunc21_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export const Component22_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export function utilFunc23_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-
-
-export const Component25_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export function utilFunc26_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export const Component27_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-
-
-export const Component29_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export const Component30_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export function utilFunc31_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export const Component32_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export function utilFunc33_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export const Component34_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export function utilFunc35_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export function utilFunc36_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export function utilFunc37_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export function utilFunc38_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export function utilFunc39_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export const Component40_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export const Component41_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component42_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component43_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component44_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component45_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component46_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export function utilFunc47_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc48_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export function utilFunc49_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export function utilFunc50_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export const Component51_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export const Component52_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export function utilFunc53_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc54_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export const Component55_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export function utilFunc56_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export function utilFunc57_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export function utilFunc58_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export function utilFunc59_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc60_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export function utilFunc61_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export const Component62_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export function utilFunc63_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export function utilFunc64_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export const Component65_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export function utilFunc66_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export const Component67_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export const Component68_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export const Component69_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export function utilFunc70_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export const Component71_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export const Component72_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export const Component73_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export const Component74_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export const Component75_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export function utilFunc76_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export const Component77_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export function utilFunc78_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export function utilFunc79_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export const Component80_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export function utilFunc81_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export function utilFunc82_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export function utilFunc83_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export const Component84_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export const Component85_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component86_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export function utilFunc87_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export function utilFunc88_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export const Component89_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export function utilFunc90_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export function utilFunc91_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export function utilFunc92_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export const Component93_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export function utilFunc94_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export function utilFunc95_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export function utilFunc96_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export const Component97_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export const Component98_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export const Component99_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export function utilFunc100_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export function utilFunc101_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export function utilFunc102_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export const Component103_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export function utilFunc104_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc105_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export function utilFunc106_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc107_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc108_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export const Component109_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export const Component110_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export function utilFunc111_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export function utilFunc112_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export const Component113_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export const Component114_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component115_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export function utilFunc116_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export const Component117_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component118_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component119_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export function utilFunc120_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export function utilFunc121_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc122_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export const Component123_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export function utilFunc124_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc125_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export const Component126_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export function utilFunc127_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export function utilFunc128_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export const Component129_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export function utilFunc130_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export function utilFunc131_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export const Component132_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component133_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component134_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export function utilFunc135_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export function utilFunc136_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export function utilFunc137_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export function utilFunc138_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export function utilFunc139_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export function utilFunc140_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export const Component141_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export const Component142_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export const Component143_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export const Component144_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export function utilFunc145_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export const Component146_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component147_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export const Component148_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export function utilFunc149_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export const Component150_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export function utilFunc151_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export function utilFunc152_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export const Component153_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export function utilFunc154_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export const Component155_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export function utilFunc156_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc157_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc158_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export const Component159_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export function utilFunc160_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc161_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
+        scale = pacer.rescale(-1) if pacer is not None else 1.0  # last entry is the final save alone
+        now_ns = scheduler.clock()
+        if timed_save(backend, keys, scheduler, metrics, log):
+            save_policy.saved(checkpoint.chars, now_ns)
+            scheduler.wait(final_settle * scale)
+        backend.flush()
+        checkpoint.clear()
+
+        report = scheduler.report()
+        report['seed'] = seed
+        report.update(save_policy.report())
+        if planner is not None:
+            report.update(planner.report())
+        log("✅ Finished typing with saves.")
+        log(f"⏱️ {report['elapsed_s']:.1f}s elapsed, drift {report['drift_ms']:.1f} ms (max {report['max_drift_ms']:.1f} ms)")
+        log(f"💾 {report['saves']} saves, at most {report['max_chars_at_risk']} chars / {report['max_seconds_at_risk']:.0f}s unsaved")
+        if metrics is not None:
+            metrics.detach()
+            report['metrics'] = metrics.summary()
+            lateness = report['metrics']['key_lateness']
+            log(f"📈 {report['metrics']['keys']} keys, lateness p50 {lateness['p50_us'] / 1e3:.2f} ms, "
+                f"p99 {lateness['p99_us'] / 1e3:.2f} ms, max {lateness['max_us'] / 1e3:.2f} ms")
+        return report
+
+    except FailSafeAbort as exc:
+        checkpoint.save()
+        if exc.__cause__ is not None:
+            log(f"❌ Typing interrupted by fail-safe: {exc}.")
+        else:
+            log("❌ Typing interrupted by fail-safe (mouse to top-left).")
+        if checkpoint.path is not None:
+            log(f"📍 Stopped at line {checkpoint.line + 1}, column {checkpoint.column + 1}. Rerun with --resume to continue.")
+        raise TypingInterrupted('fail-safe', checkpoint) from exc
+
+    except KeyboardInterrupt as exc:
+        checkpoint.save()
+        log("❌ Typing manually interrupted (Ctrl+C).")
+        if checkpoint.path is not None:
+            log(f"📍 Stopped at line {checkpoint.line + 1}, column {checkpoint.column + 1}. Rerun with --resume to continue.")
+        raise TypingInterrupted('Ctrl+C', checkpoint) from exc
+
+    finally:
+        if metrics is not None:
+            metrics.detach()
+        if failsafe is not None:
+            failsafe.stop()
+
+
+def dry_run(source, chunk_size=CHUNK_SIZE, seed=None, **options):
+    # Full run against a recorder on a virtual clock: same schedule, no waiting.
+    # Extra options go straight to hyper_slow_typing_with_saves
+    wall_start = time.perf_counter()
+    clock = VirtualClock()
+    backend = RecorderBackend(clock=clock.monotonic, sleep=clock.sleep)
+    scheduler = DeadlineScheduler(clock=clock.monotonic_ns, sleep=clock.sleep)
+    line_end_ns = []
+
+    report = hyper_slow_typing_with_saves(
+        source, backend, chunk_size, seed, scheduler,
+        log=quiet_log, on_line=lambda i, elapsed_ns: line_end_ns.append(elapsed_ns),
+        **options,
+    )
+
+    # The first line starts with the first key: after the start delay, or
+    # right away with pacing off
+    first_ns = round(backend.events[0][0] * 1e9) if backend.events else 0
+    line_s = np.diff(np.asarray(line_end_ns, dtype=np.int64), prepend=first_ns) / 1e9
+    report.update({
+        'simulated_s': report['elapsed_s'],
+        'chars': len(backend.text),
+        'line_s': line_s.tolist(),
+        'wall_ms': (time.perf_counter() - wall_start) * 1e3,
+    })
+    return report
+
+# Above this many uniform draws per estimate, sums are sampled from their
+# normal limit instead; with thousands of terms the difference is negligible
+EXACT_DRAW_LIMIT = 4_000_000
+
+
+class UniformSum:
+    # Running model of sum(w * U(low, high)) over streamed weights. The weights
+    # themselves are kept only while exact sampling stays under the draw limit
+    def __init__(self, low, high, simulations):
+        self.low = low
+        self.high = high
+        self.budget = EXACT_DRAW_LIMIT // simulations
+        self.count = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.weights = []
+
+    def add(self, weights):
+        self.count += len(weights)
+        self.total += float(weights.sum())
+        self.total_sq += float((weights ** 2).sum())
+        if self.count > self.budget:
+            self.weights = None
+        elif self.weights is not None:
+            self.weights.append(weights)
+
+    def sample(self, rng, simulations):
+        if self.weights is not None:
+            weights = np.concatenate(self.weights) if self.weights else np.zeros(0)
+            return rng.uniform(self.low, self.high, (simulations, len(weights))) @ weights
+        mean = (self.low + self.high) / 2 * self.total
+        std = (self.high - self.low) / np.sqrt(12) * np.sqrt(self.total_sq)
+        return rng.normal(mean, std, simulations)
+
+
+def estimate_runtime(source, simulations=10_000, chunk_size=CHUNK_SIZE, seed=None, scale=1.0, planner=None,
+                     templates=False, overlap_saves=True, paste_regions=(), paste_threshold=None, save_policy=None):
+    # Monte Carlo over the pacing model: total duration percentiles and saves.
+    # scale multiplies every delay; 0.0 is a run with pacing off. A save
+    # policy other than the plain coin flip is walked once along the mean
+    # timeline, so its save count comes out as a single value
+    rng = np.random.default_rng(seed)
+    keys = UniformSum(0.4, 0.8, simulations)
+    pauses = UniformSum(1.5, 2.5, simulations)
+    line_pauses = UniformSum(2.5, 5.5, simulations)
+    line_count = 0
+    policy = None
+    if save_policy is not None and not save_policy.coin_flip_only:
+        policy = copy.copy(save_policy)
+        policy.start(0, 0)
+        chars = 0
+        now_ns = 0
+        policy_saves = 0
+
+    # Only the payload's shape matters here, so the block seed is arbitrary
+    # Pasted chunks carry no key delays and a pasted run only one line pause
+    marked = typed_lines(open_payload(source), paste_regions, paste_threshold, planner, templates)
+    for schedule in iter_schedules(marked, chunk_size):
+        typed = schedule.chunk_interval > 0
+        length = schedule.chunk_end - schedule.chunk_start
+        keys.add(length[typed].astype(float))
+        pauses.add(np.ones(int((schedule.chunk_pause > 0).sum())))
+        paused = schedule.line_pause > 0
+        line_pauses.add(np.ones(int(paused.sum())))
+        line_count += int(paused.sum())
+        if policy is None:
+            continue
+
+        # Mean seconds and characters up to each line end; only lines with a
+        # pause end a run and get the save check
+        chunk_s = np.where(typed, length * 0.6, 0.0) + (schedule.chunk_pause > 0) * 2.0
+        line_ends = schedule.line_chunk_end
+        line_s = np.diff(np.concatenate(([0.0], np.cumsum(chunk_s)))[line_ends], prepend=0.0) + paused * 4.0
+        line_chars = np.diff(np.concatenate(([0], np.cumsum(length)))[line_ends], prepend=0)
+        ends_ns = now_ns + np.cumsum(np.round(line_s * scale * 1e9)).astype(np.int64)
+        ends_chars = chars + np.cumsum(line_chars)
+        for i in np.flatnonzero(paused).tolist():
+            if policy.due(schedule.lines[i], schedule.save[i], int(ends_chars[i]), int(ends_ns[i])):
+                policy.saved(int(ends_chars[i]), int(ends_ns[i]))
+                policy_saves += 1
+        now_ns = int(ends_ns[-1])
+        chars = int(ends_chars[-1])
+
+    total = (
+        START_DELAY
+        + keys.sample(rng, simulations)
+        + pauses.sample(rng, simulations)
+        + line_pauses.sample(rng, simulations)
+    )
+
+    # Each line saves with probability 1/5, plus the final save. An overlapped
+    # save settles inside its line pause, which is always the longer of the
+    # two, so then only the final save's settle adds to the run
+    if policy is None:
+        saves = rng.binomial(line_count, 0.2, simulations) + 1
+    else:
+        saves = np.full(simulations, policy_saves + 1)
+    settled = 1 if overlap_saves else saves
+    settle_mean = settled * 0.85
+    settle_std = np.sqrt(settled) * 0.7 / np.sqrt(12)
+    total += rng.normal(settle_mean, settle_std)
+    # The start delay is never scaled, only skipped along with pacing
+    total = (total - START_DELAY) * scale + (START_DELAY if scale else 0.0)
+
+    p50, p95, p99 = np.percentile(total, [50, 95, 99])
+    return {
+        'simulations': simulations,
+        'mean_s': float(total.mean()),
+        'p50_s': float(p50),
+        'p95_s': float(p95),
+        'p99_s': float(p99),
+        'expected_saves': float(saves.mean()),
+        'p95_saves': float(np.percentile(saves, 95)),
+    }
+
+
+# Synthetic payload sizes, in lines, that the benchmark suite runs besides the sample
+BENCH_SIZES = (3_000, 30_000, 300_000)
+
+# Timed engine runs per payload; the fastest counts, as the least disturbed
+BENCH_REPEATS = 3
+
+# Waits the scheduler jitter benchmark sleeps through, and how long each is
+JITTER_WAITS = 500
+JITTER_WAIT_S = 0.002
+
+
+def bench_engine(label, source, seed=0, **options):
+    # The whole typing loop on a virtual clock against a NullBackend: wall
+    # time per character is the engine's overhead, best of BENCH_REPEATS. A
+    # separate traced run gives the peak Python memory, since tracemalloc
+    # slows everything down
+    def run():
+        clock = VirtualClock()
+        backend = NullBackend(sleep=clock.sleep)
+        scheduler = DeadlineScheduler(clock=clock.monotonic_ns, sleep=clock.sleep)
+        report = hyper_slow_typing_with_saves(source, backend, seed=seed, scheduler=scheduler, log=quiet_log,
+                                              **options)
+        return backend, report
+
+    wall_s = float('inf')
+    for _ in range(BENCH_REPEATS):
+        start = time.perf_counter()
+        backend, report = run()
+        wall_s = min(wall_s, time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {
+        'payload': label,
+        'keys': backend.keys,
+        'pastes': backend.pastes,
+        'saves': report['saves'],
+        'waits': report['waits'],
+        'simulated_s': report['elapsed_s'],
+        'wall_s': wall_s,
+        'chars_per_s': backend.keys / wall_s,
+        'peak_mem_mb': peak / 1e6,
+    }
+
+
+def bench_backend(backend, text=LATENCY_SAMPLE):
+    # Per-key latency plus unpaced throughput over the same text repeated
+    report = measure_key_latency(backend, text)
+    report['chars_per_s'] = measure_chars_per_second(backend, text * 100)
+    return report
+
+
+def bench_scheduler_jitter(waits=JITTER_WAITS, seconds=JITTER_WAIT_S):
+    # How late the real clock wakes the DeadlineScheduler for short waits
+    scheduler = DeadlineScheduler()
+    late_ns = np.empty(waits)
+    for i in range(waits):
+        scheduler.wait(seconds)
+        late_ns[i] = scheduler.drift_ns
+    p50, p99 = np.percentile(late_ns, [50, 99]) / 1e3
+    return {
+        'waits': waits,
+        'wait_ms': seconds * 1e3,
+        'mean_us': float(late_ns.mean() / 1e3),
+        'p50_us': float(p50),
+        'p99_us': float(p99),
+        'max_us': float(late_ns.max() / 1e3),
+    }
+
+
+@contextlib.contextmanager
+def xvfb_display():
+    # A throwaway Xvfb server, yielding its display name, or None without Xvfb
+    if shutil.which('Xvfb') is None:
+        yield None
+        return
+    read_fd, write_fd = os.pipe()
+    server = subprocess.Popen(['Xvfb', '-displayfd', str(write_fd), '-nolisten', 'tcp'],
+                              pass_fds=(write_fd,), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    os.close(write_fd)
+    try:
+        with os.fdopen(read_fd) as f:
+            number = f.readline().strip()
+        yield f':{number}' if number else None
+    finally:
+        server.terminate()
+        server.wait()
 
-export function utilFunc162_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
 
-export const Component163_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=os.path.dirname(os.path.abspath(__file__)),
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(sizes=BENCH_SIZES, seed=0, log=print):
+    # The offline suite: engine runs over the sample and synthetic payloads,
+    # fake and (under Xvfb) XTest backend latency, and scheduler jitter. The
+    # result is plain JSON, keyed so compare_benchmarks can line up two runs
+    results = {
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'engine': [],
+        'backends': [],
+        'skipped': [],
+    }
+    payloads = [('sample', SAMPLE_PAYLOAD)] + [(f'synthetic-{size}', SyntheticPayload(size, seed)) for size in sizes]
+    for label, source in payloads:
+        log(f"⏱️ Engine on {label}")
+        results['engine'].append(bench_engine(label, source, seed))
+
+    log("⏱️ Backends")
+    results['backends'].append(bench_backend(NullBackend()))
+    with xvfb_display() as display:
+        if display is None:
+            results['skipped'].append('xtest: Xvfb not found')
+        else:
+            try:
+                backend = XTestBackend(display)
+            except ImportError as exc:
+                results['skipped'].append(f'xtest: {exc}')
+            else:
+                results['backends'].append(bench_backend(backend))
+
+    log("⏱️ Scheduler jitter")
+    results['scheduler'] = bench_scheduler_jitter()
+    return results
+
+
+# Engine metrics compared across runs, and whether a higher value is better.
+# Backend latency and scheduler jitter are informational only: single
+# microsecond and millisecond samples swing far more than any tolerance
+BENCH_METRICS = {
+    'chars_per_s': True,
+    'peak_mem_mb': False,
+}
+
+
+def compare_benchmarks(baseline, current, tolerance=0.2):
+    # Engine metrics that got worse by more than tolerance (a fraction)
+    before = {entry['payload']: entry for entry in baseline['engine']}
+    regressions = []
+    for entry in current['engine']:
+        name = entry['payload']
+        old = before.get(name)
+        if old is None:
+            continue
+        for metric, higher_is_better in BENCH_METRICS.items():
+            if metric not in entry or not old.get(metric):
+                continue
+            change = entry[metric] / old[metric] - 1
+            if (-change if higher_is_better else change) > tolerance:
+                regressions.append({'bench': f'engine/{name}', 'metric': metric,
+                                    'baseline': old[metric], 'current': entry[metric], 'change': change})
+    return regressions
+
+
+class TypingOptions:
+    # Everything about a session except the payload, seed and backend. speed
+    # is a SPEED_PROFILES name or a multiplier
+    def __init__(self, chunk_size=CHUNK_SIZE, speed='natural', target_duration=None, finish_at=None,
+                 profile=None, save_policy=None, overlap_saves=True, paste_regions=(), paste_threshold=None,
+                 checkpoint_path=None, planner=None, templates=False, metrics=None):
+        if isinstance(speed, str):
+            if speed not in SPEED_PROFILES:
+                raise ValueError(f"Unknown speed {speed!r}; pick one of {', '.join(SPEED_PROFILES)} or a number")
+            speed = SPEED_PROFILES[speed]
+        elif not 0 < speed < float('inf'):
+            raise ValueError(f"A speed multiplier must be a positive number, not {speed!r}")
+        self.chunk_size = chunk_size
+        self.speed = speed
+        self.target_duration = target_duration
+        self.finish_at = finish_at
+        self.profile = profile
+        self.save_policy = save_policy
+        self.overlap_saves = overlap_saves
+        self.paste_regions = paste_regions
+        self.paste_threshold = paste_threshold
+        self.checkpoint_path = checkpoint_path
+        self.planner = planner
+        self.templates = templates
+        self.metrics = metrics
+
+    def engine_kwargs(self):
+        return {
+            'chunk_size': self.chunk_size,
+            'pacing': self.speed is not None,
+            'speed': self.speed or 1.0,
+            'target_duration': self.target_duration,
+            'finish_at': self.finish_at,
+            'profile': self.profile,
+            'save_policy': self.save_policy,
+            'overlap_saves': self.overlap_saves,
+            'paste_regions': self.paste_regions,
+            'paste_threshold': self.paste_threshold,
+            'checkpoint_path': self.checkpoint_path,
+            'planner': self.planner,
+            'templates': self.templates,
+            'metrics': self.metrics,
+        }
+
+
+class TypingEngine:
+    # Library entry point: one backend and one set of options, any number of
+    # sessions. A backend of None types on the desktop through pyautogui with
+    # the fail-safe monitor running. Interrupts raise TypingInterrupted
+    def __init__(self, backend=None, options=None, log=print, failsafe=None):
+        self.backend = backend
+        self.options = options or TypingOptions()
+        self.log = log
+        self.failsafe = failsafe
+
+    def run(self, source=None, seed=None, resume=False, scheduler=None, on_line=None):
+        return hyper_slow_typing_with_saves(
+            source, self.backend, seed=seed, scheduler=scheduler, log=self.log, on_line=on_line,
+            resume=resume, failsafe=self.failsafe, **self.options.engine_kwargs(),
+        )
+
+    def dry_run(self, source, seed=None):
+        options = self.options.engine_kwargs()
+        del options['checkpoint_path']
+        return dry_run(source, seed=seed, **options)
+
+    def estimate(self, source, simulations=10_000, seed=None):
+        scale = 1 / self.options.speed if self.options.speed else 0.0
+        options = self.options
+        return estimate_runtime(source, simulations, options.chunk_size, seed, scale, options.planner,
+                                options.templates, options.overlap_saves, options.paste_regions,
+                                options.paste_threshold, options.save_policy)
+
+
+BACKENDS = ('pyautogui', 'xtest', 'uinput', 'file')
+
+
+def make_backend(name, output=None, fsync_every=1):
+    # Returns (backend, failsafe) for TypingEngine. Backends that move real
+    # keys under a pointer get the fail-safe monitor; uinput has no pointer to
+    # watch under Wayland and the file backend has no desktop at all
+    if name == 'pyautogui':
+        return None, None
+    if name == 'xtest':
+        # Watches the pointer over Xlib too, so pyautogui is never imported
+        failsafe = FailSafeMonitor()
+        backend = XTestBackend(sleep=failsafe.sleep)
+        failsafe.position = backend.pointer_position
+        failsafe.corners = backend.screen_corners()
+        return backend, failsafe
+    if name == 'uinput':
+        return UInputBackend(), False
+    if name == 'file':
+        if output is None:
+            raise ValueError("The file backend needs --output")
+        return FileBackend(output, fsync_every), False
+    raise ValueError(f"Unknown backend {name!r}; pick one of {', '.join(BACKENDS)}")
+
+
+def parse_speed(value):
+    if value in SPEED_PROFILES:
+        return value
+    try:
+        speed = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"pick one of {', '.join(SPEED_PROFILES)} or a number") from None
+    if not 0 < speed < float('inf'):
+        raise argparse.ArgumentTypeError(f"a speed multiplier must be a positive number, not {value}")
+    return speed
 
-export function utilFunc164_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
 
-export const Component165_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component166_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export const Component167_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export const Component168_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export const Component169_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export const Component170_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component171_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export function utilFunc172_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export const Component173_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export function utilFunc174_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export const Component175_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export const Component176_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export const Component177_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component178_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export const Component179_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export function utilFunc180_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export const Component181_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export const Component182_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export const Component183_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export const Component184_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export const Component185_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export const Component186_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component187_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export function utilFunc188_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export function utilFunc189_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export const Component190_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export function utilFunc191_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export const Component192_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export function utilFunc193_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export const Component194_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export const Component195_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export function utilFunc196_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export function utilFunc197_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export function utilFunc198_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export function utilFunc199_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export const Component200_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export function utilFunc201_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export function utilFunc202_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export const Component203_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component204_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export function utilFunc205_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export const Component206_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export const Component207_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export const Component208_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export const Component209_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export function utilFunc210_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export function utilFunc211_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export const Component212_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export const Component213_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component214_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component215_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export function utilFunc216_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export const Component217_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export const Component218_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export function utilFunc219_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc220_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export function utilFunc221_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export const Component222_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export function utilFunc223_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export const Component224_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export function utilFunc225_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export function utilFunc226_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export const Component227_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export const Component228_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component229_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export function utilFunc230_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export const Component231_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export function utilFunc232_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export const Component233_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export const Component234_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export const Component235_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export function utilFunc236_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export function utilFunc237_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export function utilFunc238_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export function utilFunc239_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export const Component240_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export function utilFunc241_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export const Component242_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export function utilFunc243_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export const Component244_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export function utilFunc245_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export const Component246_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export const Component247_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export const Component248_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export const Component249_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export const Component250_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export const Component251_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export const Component252_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export function utilFunc253_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export function utilFunc254_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export function utilFunc255_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export const Component256_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export function utilFunc257_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export function utilFunc258_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export const Component259_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export function utilFunc260_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export function utilFunc261_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export const Component262_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export function utilFunc263_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc264_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export const Component265_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export function utilFunc266_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export function utilFunc267_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export function utilFunc268_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export function utilFunc269_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc270_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export function utilFunc271_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc272_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export const Component273_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export const Component274_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export const Component275_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export const Component276_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component277_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export function utilFunc278_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc279_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export function utilFunc280_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export function utilFunc281_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export const Component282_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export function utilFunc283_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export const Component284_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export function utilFunc285_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export const Component286_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component287_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component288_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export function utilFunc289_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export function utilFunc290_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export const Component291_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export function utilFunc292_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export function utilFunc293_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export const Component294_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export function utilFunc295_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc296_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export const Component297_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export function utilFunc298_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export function utilFunc299_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export function utilFunc300_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc301_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export const Component302_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export function utilFunc303_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export const Component304_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export function utilFunc305_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export const Component306_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export function utilFunc307_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export const Component308_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export function utilFunc309_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export const Component310_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export function utilFunc311_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc312_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export const Component313_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export const Component314_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export const Component315_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export const Component316_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component317_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export const Component318_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export function utilFunc319_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export const Component320_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export const Component321_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export function utilFunc322_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export function utilFunc323_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export const Component324_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export function utilFunc325_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export function utilFunc326_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export const Component327_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export const Component328_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export function utilFunc329_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export const Component330_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export function utilFunc331_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc332_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export const Component333_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export const Component334_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component335_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export function utilFunc336_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export function utilFunc337_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export const Component338_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component339_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export const Component340_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component341_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export function utilFunc342_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export const Component343_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export const Component344_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export const Component345_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export const Component346_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export const Component347_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export function utilFunc348_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export function utilFunc349_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export function utilFunc350_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export const Component351_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export function utilFunc352_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export function utilFunc353_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export function utilFunc354_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export const Component355_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export function utilFunc356_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export const Component357_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export function utilFunc358_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export function utilFunc359_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc360_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc361_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc362_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc363_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export function utilFunc364_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export const Component365_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export function utilFunc366_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export function utilFunc367_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export function utilFunc368_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export const Component369_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export function utilFunc370_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export function utilFunc371_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export function utilFunc372_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc373_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc374_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export const Component375_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export function utilFunc376_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export function utilFunc377_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export function utilFunc378_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc379_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc380_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export const Component381_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export function utilFunc382_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export const Component383_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export function utilFunc384_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export function utilFunc385_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export const Component386_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export const Component387_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export function utilFunc388_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export function utilFunc389_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export function utilFunc390_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export function utilFunc391_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc392_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export const Component393_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export function utilFunc394_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export function utilFunc395_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc396_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export function utilFunc397_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc398_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export const Component399_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export function utilFunc400_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export function utilFunc401_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export const Component402_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export function utilFunc403_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export function utilFunc404_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export const Component405_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export function utilFunc406_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export const Component407_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export function utilFunc408_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export const Component409_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component410_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export const Component411_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export const Component412_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export const Component413_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export function utilFunc414_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export const Component415_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export function utilFunc416_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export const Component417_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export function utilFunc418_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export function utilFunc419_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export const Component420_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export function utilFunc421_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export const Component422_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component423_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export const Component424_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export const Component425_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export function utilFunc426_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export const Component427_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export function utilFunc428_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export function utilFunc429_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export function utilFunc430_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export function utilFunc431_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export const Component432_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export const Component433_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export const Component434_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export function utilFunc435_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export const Component436_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export const Component437_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export function utilFunc438_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export const Component439_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export function utilFunc440_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc441_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export function utilFunc442_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc443_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export function utilFunc444_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export const Component445_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component446_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export const Component447_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export function utilFunc448_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export const Component449_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export function utilFunc450_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export const Component451_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export const Component452_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export function utilFunc453_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export function utilFunc454_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export const Component455_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export function utilFunc456_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export const Component457_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export function utilFunc458_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export const Component459_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component460_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export function utilFunc461_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export function utilFunc462_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export const Component463_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export function utilFunc464_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc465_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc466_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export const Component467_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export function utilFunc468_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export const Component469_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export function utilFunc470_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export function utilFunc471_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export const Component472_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export function utilFunc473_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc474_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export const Component475_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export const Component476_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export function utilFunc477_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export function utilFunc478_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export const Component479_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component480_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export const Component481_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export function utilFunc482_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export const Component483_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export const Component484_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export function utilFunc485_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export const Component486_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export function utilFunc487_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export const Component488_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export const Component489_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component490_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export const Component491_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export function utilFunc492_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export const Component493_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export function utilFunc494_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export const Component495_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export const Component496_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export function utilFunc497_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export function utilFunc498_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export function utilFunc499_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export const Component500_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export function utilFunc501_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export const Component502_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export function utilFunc503_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export function utilFunc504_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export function utilFunc505_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export const Component506_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export const Component507_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export function utilFunc508_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export function utilFunc509_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export const Component510_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component511_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export const Component512_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export const Component513_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export function utilFunc514_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export function utilFunc515_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export const Component516_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export const Component517_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export const Component518_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export function utilFunc519_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export function utilFunc520_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export function utilFunc521_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export const Component522_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component523_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export const Component524_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export function utilFunc525_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc526_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export const Component527_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export const Component528_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export function utilFunc529_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export function utilFunc530_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export const Component531_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export const Component532_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export function utilFunc533_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export function utilFunc534_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export const Component535_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component536_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export const Component537_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export function utilFunc538_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export const Component539_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export const Component540_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export const Component541_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export function utilFunc542_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export function utilFunc543_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export function utilFunc544_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export const Component545_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export const Component546_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export function utilFunc547_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export function utilFunc548_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export function utilFunc549_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export const Component550_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component551_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export const Component552_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export function utilFunc553_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export function utilFunc554_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export const Component555_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export function utilFunc556_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export const Component557_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export function utilFunc558_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export function utilFunc559_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export function utilFunc560_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export function utilFunc561_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export function utilFunc562_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export const Component563_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export function utilFunc564_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export const Component565_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export const Component566_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export function utilFunc567_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc568_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export const Component569_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export const Component570_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export const Component571_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export const Component572_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export function utilFunc573_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export function utilFunc574_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export const Component575_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export const Component576_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export function utilFunc577_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export function utilFunc578_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export const Component579_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export function utilFunc580_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export const Component581_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export function utilFunc582_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export function utilFunc583_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export const Component584_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export const Component585_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export function utilFunc586_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export function utilFunc587_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export const Component588_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export const Component589_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export const Component590_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export const Component591_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export const Component592_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export function utilFunc593_debounce(func, delay) {
-  let timer;
-  return (...args) => {
-    clearTimeout(timer);
-    timer = setTimeout(() => func.apply(this, args), delay);
-  };
-}
-
-export const Component594_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export const Component595_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export function utilFunc596_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export const Component597_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export function utilFunc598_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc599_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export const Component600_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export function utilFunc601_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export const Component602_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export function utilFunc603_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-export function utilFunc604_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export const Component605_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export const Component606_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export function utilFunc607_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export function utilFunc608_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export function utilFunc609_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export const Component610_Input = ({ label, value, onChange }) => (
-  <label>{label}<input value={value} onChange={onChange} /></label>
-);
-
-export const Component611_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export const Component612_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export const Component613_Button = ({ onClick, children }) => (
-  <button onClick={onClick} className="btn">{children}</button>
-);
-
-export const Component614_Alert = ({ message, type }) => (
-  <div className={`alert alert-${type}`}>{message}</div>
-);
-
-export const Component615_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export function utilFunc616_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export const Component617_Loader = () => (
-  <div className="loader">Loading...</div>
-);
-
-export const Component618_Card = ({ title, content }) => (
-  <div className="card">
-    <h3>{title}</h3>
-    <p>{content}</p>
-  </div>
-);
-
-export function utilFunc619_capitalize(text) {
-  return text.charAt(0).toUpperCase() + text.slice(1);
-}
-
-export function utilFunc620_isEmailValid(email) {
-  return /^[^@]+@[^@]+[^@]+$/.test(email);
-}
-
-export function utilFunc621_truncate(text, length = 100) {
-  return text.length > length ? text.slice(0, length) + '...' : text;
-}
-
-export function utilFunc622_formatDate(date) {
-  return new Date(date).toLocaleDateString();
-}
-
-"""
-
-hyper_slow_typing_with_saves(code)
+def parse_region(value):
+    # FIRST:LAST as 1-based inclusive line numbers, as an editor shows them,
+    # to the 0-based half-open (start, end) of mark_paste_lines
+    try:
+        first, last = (int(part) for part in value.split(':'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected FIRST:LAST line numbers, not {value}") from None
+    if not 1 <= first <= last:
+        raise argparse.ArgumentTypeError(f"expected 1 <= FIRST <= LAST, not {value}")
+    return first - 1, last
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Type payloads into an editor at a human pace, saving as it goes.")
+    parser.add_argument('payloads', nargs='*', metavar='PAYLOAD',
+                        help="files to type one after another ('-' for stdin); defaults to the sample payload")
+    parser.add_argument('--synthetic', type=int, metavar='LINES',
+                        help="type a generated payload of about this many lines instead")
+    parser.add_argument('--payload-seed', type=int, default=0, help="seed of the --synthetic payload")
+    parser.add_argument('--backend', choices=BACKENDS, default='pyautogui')
+    parser.add_argument('--output', help="target file for the file backend")
+    parser.add_argument('--fsync-every', type=int, default=1, metavar='SAVES',
+                        help="file backend: fsync on every this many saves (default: 1)")
+    parser.add_argument('--profile', choices=KEY_PROFILES, help="editor key profile (default: detected)")
+    parser.add_argument('--speed', type=parse_speed, default='natural',
+                        help=f"{', '.join(SPEED_PROFILES)} or a multiplier (default: natural)")
+    parser.add_argument('--duration', type=float, help="stretch or squeeze each payload to this many seconds")
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+    parser.add_argument('--paste-region', type=parse_region, action='append', default=[], metavar='FIRST:LAST',
+                        help="paste these lines (1-based, inclusive) instead of typing them; repeatable")
+    parser.add_argument('--paste-threshold', type=int,
+                        help="paste blank-line separated blocks of at least this many characters")
+    parser.add_argument('--reuse-templates', action='store_true',
+                        help="paste what blocks repeating an earlier block's template share with it, typing only what changed")
+    parser.add_argument('--plan-keys', action='store_true',
+                        help="skip keys the editor's auto-indent and auto-close already produce")
+    parser.add_argument('--indent-size', type=int, default=4, help="the editor's tab size, for --plan-keys")
+
+    saves = parser.add_argument_group('save policy')
+    saves.add_argument('--no-coin-flip', action='store_true', help="drop the random 1-in-5 line saves")
+    saves.add_argument('--save-every-keys', type=int)
+    saves.add_argument('--save-every-seconds', type=float)
+    saves.add_argument('--save-on-boundary', action='store_true', help="save after top-level statements and blocks")
+    saves.add_argument('--save-min-interval', type=float)
+    saves.add_argument('--no-overlap-saves', action='store_true', help="wait out the save settle after the line pause")
+
+    parser.add_argument('--metrics-json', metavar='PATH', help="write per-key timing histograms as a JSON summary")
+    parser.add_argument('--metrics-prom', metavar='PATH', help="write them in Prometheus text format")
+    parser.add_argument('--checkpoint', default=CHECKPOINT_PATH)
+    parser.add_argument('--resume', action='store_true', help="continue from the checkpoint, then type the rest")
+    modes = parser.add_mutually_exclusive_group()
+    modes.add_argument('--dry-run', action='store_true', help="simulate on a virtual clock and print the report")
+    modes.add_argument('--estimate', action='store_true', help="print Monte Carlo runtime percentiles")
+    modes.add_argument('--bench-xtest', action='store_true')
+    modes.add_argument('--bench-uinput', action='store_true')
+    modes.add_argument('--bench', action='store_true',
+                       help="run the offline benchmark suite and print its JSON results")
+    parser.add_argument('--bench-sizes', type=int, nargs='+', default=BENCH_SIZES, metavar='LINES',
+                        help="synthetic payload sizes for --bench")
+    parser.add_argument('--bench-baseline', help="earlier --bench JSON; exit 1 if engine speed or memory regressed past 20%%")
+    args = parser.parse_args(argv)
+    if args.synthetic is not None and args.payloads:
+        parser.error("--synthetic replaces the payload files")
+    # Payload raises on a missing file only once its session starts; catch
+    # typos before the first payload is typed
+    for path in args.payloads:
+        if path != '-' and not os.path.isfile(path):
+            parser.error(f"no such payload file: {path}")
+    if args.duration is not None and '-' in args.payloads:
+        parser.error("--duration reads the payload twice, which stdin can't do")
+    if args.resume and (args.dry_run or args.estimate):
+        parser.error("--resume continues a real run; --dry-run and --estimate always start from the top")
+    if args.resume and not os.path.exists(args.checkpoint):
+        parser.error(f"no checkpoint at {args.checkpoint} to resume from")
+    if args.fsync_every < 1:
+        parser.error("--fsync-every must be at least 1")
+    if args.backend == 'file' and len(args.payloads) > 1:
+        parser.error("the file backend writes one payload per --output")
+    return args
+
+
+def main(argv=None):
+    # Usage errors exit 2 with a message; the engine reports bad option
+    # combinations and unreadable files as ValueError and OSError
+    args = parse_args(argv)
+    try:
+        return run_command(args)
+    except (ValueError, OSError) as exc:
+        print(f"{os.path.basename(sys.argv[0])}: error: {exc}", file=sys.stderr)
+        return 2
+
+
+def run_command(args):
+    if args.bench_xtest:
+        print(json.dumps(xtest_latency_benchmark(), indent=2))
+        return 0
+    if args.bench_uinput:
+        print(json.dumps(uinput_latency_benchmark(), indent=2))
+        return 0
+    if args.bench:
+        results = run_benchmarks(args.bench_sizes, args.payload_seed, log=lambda message: print(message, file=sys.stderr))
+        if args.bench_baseline:
+            with open(args.bench_baseline) as f:
+                results['regressions'] = compare_benchmarks(json.load(f), results)
+        print(json.dumps(results, indent=2))
+        return 1 if results.get('regressions') else 0
+
+    save_policy = SavePolicy(not args.no_coin_flip, args.save_every_keys, args.save_every_seconds,
+                             args.save_on_boundary, args.save_min_interval)
+    options = TypingOptions(args.chunk_size, args.speed, args.duration, profile=args.profile, save_policy=save_policy,
+                            overlap_saves=not args.no_overlap_saves, paste_regions=args.paste_region,
+                            paste_threshold=args.paste_threshold,
+                            checkpoint_path=args.checkpoint,
+                            planner=KeystrokePlanner(args.indent_size) if args.plan_keys else None,
+                            templates=args.reuse_templates,
+                            metrics=RunMetrics() if args.metrics_json or args.metrics_prom else None)
+    if args.synthetic is not None:
+        payloads = [SyntheticPayload(args.synthetic, args.payload_seed)]
+    else:
+        payloads = args.payloads or [SAMPLE_PAYLOAD]
+
+    if args.dry_run or args.estimate:
+        engine = TypingEngine(options=options)
+        for source in payloads:
+            if args.dry_run:
+                report = engine.dry_run(source, args.seed)
+                del report['line_s']
+            else:
+                report = engine.estimate(source, seed=args.seed)
+            print(json.dumps({'payload': str(source), **report}, indent=2))
+        if options.metrics is not None:
+            options.metrics.write(args.metrics_json, args.metrics_prom)
+        return 0
+
+    if args.resume:
+        # The checkpointed payload first, then whatever was listed after it
+        source = Checkpoint.load(args.checkpoint).source
+        rest = payloads[payloads.index(source) + 1:] if source in payloads else []
+        # A synthetic payload has no path to record, so it is generated again
+        sessions = [(payloads[0] if args.synthetic is not None else None, True)] + [(path, False) for path in rest]
+    else:
+        sessions = [(path, False) for path in payloads]
+
+    backend, failsafe = make_backend(args.backend, args.output, args.fsync_every)
+    engine = TypingEngine(backend, options, failsafe=failsafe)
+    try:
+        for source, resume in sessions:
+            engine.run(source, args.seed, resume)
+    except TypingInterrupted:
+        return 1
+    finally:
+        if hasattr(backend, 'close'):
+            backend.close()
+        if options.metrics is not None:
+            options.metrics.write(args.metrics_json, args.metrics_prom)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,541 @@
+import glob
+import os
+import re
+import sys
+import types
+
+import pytest
+
+import run
+
+
+def payload_text(source):
+    return ''.join(line + '\n' for line in run.Payload(source).lines())
+
+
+def typing_run(clock, backend=None, **options):
+    # A full run on a virtual clock, returning the recorder it typed into
+    backend = backend or run.RecorderBackend(clock.monotonic, clock.sleep)
+    scheduler = run.DeadlineScheduler(clock.monotonic_ns, clock.sleep)
+    run.hyper_slow_typing_with_saves(backend=backend, scheduler=scheduler, log=run.quiet_log, **options)
+    return backend
+
+
+@pytest.mark.parametrize('error', [run.FailSafeAbort, KeyboardInterrupt])
+@pytest.mark.parametrize('at', [7.2, 100.3, 1234.5])
+def test_resume_after_interrupt_between_keys(tmp_path, error, at):
+    # The interrupt lands in the backend's sleep between two keys of a chunk
+    checkpoint_path = str(tmp_path / 'checkpoint.json')
+    clock = run.VirtualClock()
+
+    def sleep(seconds):
+        clock.sleep(seconds)
+        if clock.monotonic() >= at:
+            raise error()
+
+    interrupted = run.RecorderBackend(clock.monotonic, sleep)
+    with pytest.raises(run.TypingInterrupted):
+        typing_run(clock, interrupted, source=run.SAMPLE_PAYLOAD, seed=7, checkpoint_path=checkpoint_path)
+    resumed = typing_run(clock, checkpoint_path=checkpoint_path, resume=True)
+    assert interrupted.text + resumed.text == payload_text(run.SAMPLE_PAYLOAD)
+
+
+def test_cli_rejects_missing_payload_file(capsys):
+    with pytest.raises(SystemExit) as exc:
+        run.main(['--dry-run', 'no_such_payload.js'])
+    assert exc.value.code == 2
+    assert 'no such payload file' in capsys.readouterr().err
+
+
+class RecordingEditor(run.EditorModel):
+    # Keeps every line the cursor leaves, i.e. the finished document
+    def __init__(self, indent_size):
+        super().__init__(indent_size)
+        self.rows = []
+
+    def leave(self):
+        line = super().leave()
+        self.rows.append(line)
+        return line
+
+
+def plan_and_replay(text, indent_size):
+    # The lines the planner promises, and what its keys leave in the model
+    planner = run.KeystrokePlanner(indent_size)
+    planned = list(planner.plan(run.strip_lines(run.iter_text_lines(text))))
+    editor = RecordingEditor(indent_size)
+    for _, keys in planned:
+        for key in keys:
+            editor.press(key)
+        if not keys.endswith(run.NEXT_LINE):
+            editor.press('\n')
+    assert not editor.below
+    document = '\n'.join(editor.rows + [editor.row])
+    return planned, document, planner.report()
+
+
+def test_planner_skips_auto_indent_and_closers():
+    text = 'function f(a) {\n  return [a, "b"];\n}\n'
+    planned, document, report = plan_and_replay(text, 2)
+    assert document == text
+    # The body's indent and the auto-closed ", ] and } are not typed: End
+    # jumps over the closers and Down+End reaches the } an Enter pushed down
+    assert [keys for _, keys in planned] == [
+        'function f(a) {', f'return [a, "b{run.END_KEY};{run.NEXT_LINE}', '']
+    assert report['keys_saved'] > 0
+
+
+def test_planner_closes_jsx_tags():
+    text = 'const A = () => (\n  <div>\n    <p>hi</p>\n  </div>\n);\n'
+    planned, document, _ = plan_and_replay(text, 2)
+    assert document == text
+    assert all('</p>' not in keys and '</div>' not in keys for _, keys in planned)
+
+
+def test_planner_empties_whitespace_only_lines():
+    text = 'if (a) {\n  b();\n    \n  c();\n}\n'
+    planned, document, _ = plan_and_replay(text, 2)
+    assert [line for line, _ in planned] == ['if (a) {', '  b();', '', '  c();', '}']
+    assert document == 'if (a) {\n  b();\n\n  c();\n}\n'
+
+
+def test_planner_rejects_tabs():
+    with pytest.raises(ValueError):
+        plan_and_replay('if (a) {\n\tb();\n}\n', 4)
+
+
+@pytest.mark.parametrize('profile', ['vim', 'nano', 'file'])
+def test_planner_needs_vscode_profile(profile):
+    with pytest.raises(ValueError, match=profile):
+        typing_run(run.VirtualClock(), source=run.SAMPLE_PAYLOAD, profile=profile,
+                   planner=run.KeystrokePlanner())
+
+
+def test_planner_rejects_payload_before_typing(tmp_path):
+    path = tmp_path / 'tabs.js'
+    path.write_text('a();\nif (a) {\n\tb();\n}\n')
+    clock = run.VirtualClock()
+    backend = run.RecorderBackend(clock.monotonic, clock.sleep)
+    with pytest.raises(ValueError):
+        typing_run(clock, backend, source=str(path), profile='vscode-linux', planner=run.KeystrokePlanner())
+    assert backend.text == ''
+
+
+@pytest.mark.parametrize('indent_size', [2, 4])
+@pytest.mark.parametrize('path', [run.SAMPLE_PAYLOAD] + sorted(
+    glob.glob(os.path.join(os.path.dirname(run.SAMPLE_PAYLOAD), 'src', '**', '*.js*'), recursive=True)))
+def test_planner_reproduces_payloads(path, indent_size):
+    with open(path) as f:
+        text = f.read()
+    planned, document, _ = plan_and_replay(text, indent_size)
+    assert document == ''.join(line + '\n' for line, _ in planned)
+
+
+@pytest.mark.parametrize('overlap_saves', [True, False])
+def test_estimate_brackets_dry_runs(overlap_saves):
+    estimate = run.estimate_runtime(run.SAMPLE_PAYLOAD, 2000, seed=0, overlap_saves=overlap_saves)
+    runs = [run.dry_run(run.SAMPLE_PAYLOAD, seed=seed, overlap_saves=overlap_saves)['simulated_s'] for seed in range(5)]
+    spread = estimate['p95_s'] - estimate['p50_s']
+    assert abs(sum(runs) / len(runs) - estimate['p50_s']) < spread
+
+
+def test_engine_estimate_follows_paste_and_save_options():
+    options = run.TypingOptions(save_policy=run.SavePolicy(coin_flip=False, every_keys=500), paste_threshold=150)
+    engine = run.TypingEngine(run.NullBackend(), options, log=run.quiet_log)
+    estimate = engine.estimate(run.SAMPLE_PAYLOAD, 2000, seed=0)
+    report = engine.dry_run(run.SAMPLE_PAYLOAD, seed=1)
+    assert estimate['expected_saves'] == pytest.approx(report['saves'], rel=0.05)
+    assert estimate['p50_s'] == pytest.approx(report['simulated_s'], rel=0.01)
+
+
+def test_compare_benchmarks_gates_engine_metrics_only():
+    def results(chars_per_s, jitter_us):
+        return {
+            'engine': [{'payload': 'sample', 'chars_per_s': chars_per_s, 'peak_mem_mb': 1.0}],
+            'backends': [{'backend': 'null', 'p99_us': jitter_us}],
+            'scheduler': {'mean_us': jitter_us},
+        }
+
+    assert run.compare_benchmarks(results(1000.0, 100.0), results(950.0, 300.0)) == []
+    regressions = run.compare_benchmarks(results(1000.0, 100.0), results(500.0, 100.0))
+    assert [(entry['bench'], entry['metric']) for entry in regressions] == [('engine/sample', 'chars_per_s')]
+
+
+@pytest.mark.parametrize('argv', [
+    ['--estimate', '--speed', '0'],
+    ['--estimate', '--speed', '-2'],
+    ['--resume', '--checkpoint', 'no_such_checkpoint.json'],
+])
+def test_cli_usage_errors(argv):
+    with pytest.raises(SystemExit) as exc:
+        run.main(argv)
+    assert exc.value.code == 2
+
+
+def test_cli_reports_engine_errors_without_traceback(capsys):
+    assert run.main(['--dry-run', '--plan-keys', '--reuse-templates']) == 2
+    assert "can't be combined" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize('pacing', [True, False])
+def test_dry_run_line_times_are_never_negative(pacing):
+    report = run.dry_run(run.SAMPLE_PAYLOAD, seed=1, pacing=pacing)
+    assert min(report['line_s']) >= 0
+    assert sum(report['line_s']) <= report['simulated_s']
+
+
+def interrupted_run(tmp_path, at, **options):
+    # Runs the sample until virtual time at, returning the recorder and checkpoint path
+    checkpoint_path = str(tmp_path / 'checkpoint.json')
+    clock = run.VirtualClock()
+
+    def sleep(seconds):
+        clock.sleep(seconds)
+        if clock.monotonic() >= at:
+            raise KeyboardInterrupt()
+
+    backend = run.RecorderBackend(clock.monotonic, sleep)
+    with pytest.raises(run.TypingInterrupted):
+        typing_run(clock, backend, source=run.SAMPLE_PAYLOAD, seed=3, checkpoint_path=checkpoint_path, **options)
+    return clock, backend, checkpoint_path
+
+
+@pytest.mark.parametrize('options', [{'templates': True}, {'paste_threshold': 150}])
+def test_resume_keeps_line_layout(tmp_path, options):
+    clock, interrupted, checkpoint_path = interrupted_run(tmp_path, 2000.7, **options)
+    resumed = typing_run(clock, checkpoint_path=checkpoint_path, resume=True, **options)
+    assert interrupted.text + resumed.text == payload_text(run.SAMPLE_PAYLOAD)
+
+
+def test_resume_rejects_other_line_layout(tmp_path):
+    clock, _, checkpoint_path = interrupted_run(tmp_path, 2000.7, templates=True)
+    with pytest.raises(ValueError, match='templates=True'):
+        typing_run(clock, checkpoint_path=checkpoint_path, resume=True)
+
+
+def test_resume_rejects_other_payload(tmp_path):
+    clock, _, checkpoint_path = interrupted_run(tmp_path, 2000.7)
+    with pytest.raises(ValueError, match='payload='):
+        typing_run(clock, source=run.SyntheticPayload(200), checkpoint_path=checkpoint_path, resume=True)
+
+
+def test_resume_needs_payload_when_checkpoint_has_none(tmp_path):
+    checkpoint_path = str(tmp_path / 'checkpoint.json')
+    clock = run.VirtualClock()
+
+    def sleep(seconds):
+        clock.sleep(seconds)
+        if clock.monotonic() >= 500:
+            raise KeyboardInterrupt()
+
+    synthetic = run.SyntheticPayload(200, seed=4)
+    with pytest.raises(run.TypingInterrupted):
+        typing_run(clock, run.RecorderBackend(clock.monotonic, sleep), source=synthetic,
+                   checkpoint_path=checkpoint_path)
+    with pytest.raises(ValueError, match='records no payload'):
+        typing_run(clock, checkpoint_path=checkpoint_path, resume=True)
+    typing_run(clock, source=run.SyntheticPayload(200, seed=4), checkpoint_path=checkpoint_path, resume=True)
+
+
+@pytest.mark.parametrize('mode', ['--dry-run', '--estimate'])
+def test_cli_rejects_resume_in_simulations(tmp_path, mode, capsys):
+    checkpoint_path = tmp_path / 'checkpoint.json'
+    checkpoint_path.write_text('{}')
+    with pytest.raises(SystemExit):
+        run.parse_args([mode, '--resume', '--checkpoint', str(checkpoint_path)])
+    assert '--resume continues a real run' in capsys.readouterr().err
+
+
+def test_xtest_failsafe_polls_pointer_without_pyautogui(monkeypatch):
+    # A stand-in for python-xlib: one keysym per keycode and a pointer in a corner
+    class Screen:
+        width_in_pixels, height_in_pixels = 800, 600
+        root = types.SimpleNamespace(query_pointer=lambda: types.SimpleNamespace(root_x=799, root_y=0))
+
+    class Display:
+        def __init__(self, name=None):
+            self.display = types.SimpleNamespace(info=types.SimpleNamespace(min_keycode=8, max_keycode=9))
+
+        def get_keyboard_mapping(self, first, count):
+            return [[0xffe1], [ord('a')]]
+
+        def screen(self):
+            return Screen()
+
+    xlib = types.ModuleType('Xlib')
+    xlib.X = types.SimpleNamespace(KeyPress=2, KeyRelease=3)
+    xlib.XK = types.SimpleNamespace(XK_Shift_L=0xffe1)
+    xlib.display = types.SimpleNamespace(Display=Display)
+    ext = types.ModuleType('Xlib.ext')
+    ext.xtest = types.SimpleNamespace(fake_input=lambda *args: None)
+    monkeypatch.setitem(sys.modules, 'Xlib', xlib)
+    monkeypatch.setitem(sys.modules, 'Xlib.ext', ext)
+    monkeypatch.delitem(sys.modules, 'pyautogui', raising=False)
+
+    backend, failsafe = run.make_backend('xtest')
+    failsafe.start()
+    try:
+        assert failsafe.abort.wait(1.0)
+    finally:
+        failsafe.stop()
+    assert 'pyautogui' not in sys.modules
+
+
+def test_pyautogui_backend_owns_its_failsafe(monkeypatch):
+    pyautogui = types.ModuleType('pyautogui')
+    pyautogui.FAILSAFE = True
+    monkeypatch.setitem(sys.modules, 'pyautogui', pyautogui)
+
+    backend = run.PyAutoGUIBackend()
+    assert isinstance(backend.failsafe, run.FailSafeMonitor)
+    assert backend.sleep == backend.failsafe.sleep
+    assert pyautogui.FAILSAFE is False
+
+    pyautogui.FAILSAFE = True
+    backend = run.PyAutoGUIBackend(failsafe=False)
+    assert backend.failsafe is None
+    assert pyautogui.FAILSAFE is True
+
+
+def test_failsafe_aborts_when_pointer_is_unreadable():
+    def position():
+        raise OSError("display went away")
+
+    failsafe = run.FailSafeMonitor(position=position, corners=[(0, 0)])
+    failsafe.start()
+    try:
+        assert failsafe.abort.wait(1.0)
+    finally:
+        failsafe.stop()
+    with pytest.raises(run.FailSafeAbort) as exc:
+        failsafe.check()
+    assert isinstance(exc.value.__cause__, OSError)
+
+
+def test_file_backend_resume_truncates_past_checkpoint(tmp_path):
+    path = str(tmp_path / 'out.js')
+    with open(path, 'w') as f:
+        f.write('abcdef')
+    backend = run.FileBackend(path)
+    backend.begin(4)
+    backend.type_text('XY')
+    backend.close()
+    with open(path) as f:
+        assert f.read() == 'abcdXY'
+
+
+def test_file_backend_refuses_resume_into_short_file(tmp_path):
+    path = str(tmp_path / 'out.js')
+    with open(path, 'w') as f:
+        f.write('ab')
+    backend = run.FileBackend(path)
+    with pytest.raises(ValueError, match='holds 2 of the 4'):
+        backend.begin(4)
+    with pytest.raises(ValueError, match='gone'):
+        run.FileBackend(str(tmp_path / 'missing.js')).begin(4)
+    with open(path) as f:
+        assert f.read() == 'ab'
+
+
+def test_cli_passes_fsync_every_to_file_backend(tmp_path):
+    args = run.parse_args(['--backend', 'file', '--output', str(tmp_path / 'out.js'), '--fsync-every', '8'])
+    backend, failsafe = run.make_backend(args.backend, args.output, args.fsync_every)
+    assert backend.fsync_every == 8
+    with pytest.raises(SystemExit):
+        run.parse_args(['--fsync-every', '0'])
+
+
+def test_checkpoint_writes_are_rate_limited(tmp_path):
+    checkpoint = run.Checkpoint(str(tmp_path / 'checkpoint.json'))
+    checkpoint.save(min_interval=60)
+    checkpoint.line = 5
+    checkpoint.save(min_interval=60)
+    assert run.Checkpoint.load(checkpoint.path).line == 0
+    checkpoint.save()
+    assert run.Checkpoint.load(checkpoint.path).line == 5
+
+
+def test_payload_text_is_explicit(tmp_path):
+    assert list(run.Payload.from_text('a;').lines()) == ['a;']
+    assert list(run.Payload('a;\nb;\n').lines()) == ['a;', 'b;']
+    assert run.Payload.from_text('-').path is None
+    with pytest.raises(FileNotFoundError):
+        run.Payload('no_such_payload.js')
+    with pytest.raises(FileNotFoundError):
+        run.Payload(tmp_path / 'missing.js')
+    path = tmp_path / 'payload.js'
+    path.write_text('x;\n')
+    assert run.Payload(path).path == str(path)
+
+
+def test_mark_paste_lines_regions_and_threshold():
+    lines = ['a', 'b', 'c', '', 'long block', 'x', '', 'd']
+    assert [paste for _, paste in run.mark_paste_lines(lines, [(1, 3)])] == [
+        False, True, True, False, False, False, False, False]
+    marked = list(run.mark_paste_lines(lines, threshold=12))
+    assert [line for line, _ in marked] == lines
+    assert [paste for _, paste in marked] == [False, False, False, False, True, True, False, False]
+
+
+def test_cli_paste_region_is_one_based_and_inclusive():
+    args = run.parse_args(['--paste-region', '2:3', '--paste-region', '10:10'])
+    assert args.paste_region == [(1, 3), (9, 10)]
+    for bad in ['3:2', '0:4', '7']:
+        with pytest.raises(SystemExit):
+            run.parse_args(['--paste-region', bad])
+
+
+def test_clipboard_paste_waits_on_backend_sleep(monkeypatch):
+    clipboard = ['before']
+    pyperclip = types.ModuleType('pyperclip')
+    pyperclip.paste = lambda: clipboard[0]
+    pyperclip.copy = lambda text: clipboard.__setitem__(0, text)
+    monkeypatch.setitem(sys.modules, 'pyperclip', pyperclip)
+    monkeypatch.setattr(run.time, 'sleep', lambda seconds: pytest.fail("slept outside the backend"))
+    clock = run.VirtualClock()
+    backend = run.RecorderBackend(clock.monotonic, clock.sleep)
+
+    run.clipboard_paste(backend, 'pasted', [('ctrl', 'v')])
+    assert clock.monotonic() == pytest.approx(run.CLIPBOARD_SETTLE)
+    assert clipboard == ['before']
+
+
+@pytest.mark.parametrize('platform, profile', [('darwin', 'vscode-macos'), ('win32', 'vscode-windows'),
+                                               ('linux', 'vscode-linux')])
+def test_detect_profile(monkeypatch, platform, profile):
+    monkeypatch.delenv('TYPING_PROFILE', raising=False)
+    monkeypatch.setattr(run.sys, 'platform', platform)
+    assert run.detect_profile() == profile
+    monkeypatch.setenv('TYPING_PROFILE', 'vim')
+    assert run.detect_profile() == 'vim'
+
+
+def test_press_cmd_s_skips_missing_save_keys():
+    backend = run.RecorderBackend()
+    assert not run.press_cmd_s(backend, {'save': None, 'paste': None}, log=run.quiet_log)
+    assert backend.events == []
+    assert run.press_cmd_s(backend, run.KEY_PROFILES['vim'], log=run.quiet_log)
+    assert backend.events[0][1:] == ('hotkey', ('esc',))
+    assert backend.text == ':w\na'
+
+
+def test_vim_pastes_register_literally():
+    backend = run.RecorderBackend()
+    run.send_keys(backend, run.KEY_PROFILES['vim']['paste'])
+    assert [event[2] for event in backend.events if event[1] == 'hotkey'] == [('ctrl', 'r'), ('ctrl', 'o')]
+    assert backend.text == '+'
+
+
+def test_histogram_buckets_cover_values():
+    previous = -1
+    for value in list(range(300)) + [2 ** 20 - 1, 2 ** 20, 123456789]:
+        index = run.LatencyHistogram.bucket(value)
+        low, high = run.LatencyHistogram.bucket_bounds(index)
+        assert low <= value <= high
+        assert high - low <= max(low, 1) / 2 ** (run.HISTOGRAM_BITS - 1)
+        assert index >= previous
+        previous = index
+    assert run.LatencyHistogram.bucket_bounds(run.LatencyHistogram.bucket(100)) == (100, 100)
+
+
+def test_histogram_percentiles_and_cumulative():
+    hist = run.LatencyHistogram()
+    for value in range(1, 1001):
+        hist.record(value * 1000)
+    hist.record(-5)
+    assert hist.count == 1001 and hist.min == 0 and hist.max == 1_000_000
+    assert hist.percentile(50) == pytest.approx(500_000, rel=1 / 64)
+    assert hist.percentile(99) == pytest.approx(990_000, rel=1 / 64)
+    assert hist.percentile(100) == hist.max
+    assert hist.cumulative([0, 99, 10 ** 9]) == [1, 1, 1001]
+    counts = hist.cumulative([2 ** 16 - 1, 2 ** 17 - 1])
+    assert counts == [1 + 65, 1 + 131]
+
+
+def test_prometheus_histograms_are_cumulative():
+    metrics = run.RunMetrics()
+    for ns in (500, 2_000, 300_000, 6_000_000_000):
+        metrics.lateness['key'].record(ns)
+    metrics.sends['key'] = 4
+    metrics.chars = 4
+    text = metrics.prometheus()
+    assert text.endswith('\n')
+    assert 'typer_sends_total{kind="key"} 4' in text
+    buckets = [line for line in text.splitlines() if line.startswith('typer_lateness_seconds_bucket{kind="key"')]
+    counts = [int(line.rsplit(' ', 1)[1]) for line in buckets]
+    assert len(counts) == len(run.PROMETHEUS_BUCKETS) + 1
+    assert counts == sorted(counts)
+    assert counts[0] == 1 and counts[-2] == 3 and counts[-1] == 4
+    assert 'typer_lateness_seconds_count{kind="key"} 4' in text
+    assert 'typer_lateness_seconds_sum{kind="key"} 6.000302500' in text
+    assert 'typer_oversleep_seconds_count 0' in text
+
+
+@pytest.mark.parametrize('overrun', [1.0, 1.3])
+@pytest.mark.parametrize('duration', [600, 200000])
+def test_pacer_lands_on_target_duration(overrun, duration):
+    # The backend oversleeps every interval by overrun; later lines make it up
+    clock = run.VirtualClock()
+    backend = run.RecorderBackend(clock.monotonic, lambda seconds: clock.sleep(seconds * overrun))
+    scheduler = run.DeadlineScheduler(clock.monotonic_ns, clock.sleep)
+    report = run.hyper_slow_typing_with_saves(run.SAMPLE_PAYLOAD, backend, seed=2, scheduler=scheduler,
+                                              target_duration=duration, log=run.quiet_log)
+    assert report['elapsed_s'] == pytest.approx(duration, rel=1e-3)
+    assert backend.text == payload_text(run.SAMPLE_PAYLOAD)
+
+
+def test_save_policy_triggers():
+    seconds = 1_000_000_000
+    policy = run.SavePolicy(coin_flip=True)
+    assert policy.due('a', True, 0, 0) and not policy.due('a', False, 0, 0)
+
+    policy = run.SavePolicy(coin_flip=False, every_keys=100)
+    assert not policy.due('a', True, 99, 0) and policy.due('a', False, 100, 0)
+    policy.saved(100, 0)
+    assert not policy.due('a', False, 150, 0) and policy.due('a', False, 200, 0)
+
+    policy = run.SavePolicy(coin_flip=False, every_seconds=30)
+    assert not policy.due('a', False, 0, 29 * seconds) and policy.due('a', False, 0, 30 * seconds)
+
+    policy = run.SavePolicy(coin_flip=False, on_boundary=True)
+    assert [policy.due(line, False, 0, 0) for line in ['}', 'f();', '  g();', 'if (a) {', '']] == [
+        True, True, False, False, False]
+
+
+def test_save_policy_min_interval_holds_back_saves():
+    seconds = 1_000_000_000
+    policy = run.SavePolicy(coin_flip=True, min_interval=10)
+    policy.start(0, 0)
+    assert not policy.due('a', True, 50, 9 * seconds)
+    assert policy.due('a', True, 50, 10 * seconds)
+    policy.saved(50, 10 * seconds)
+    assert not policy.due('a', True, 80, 15 * seconds)
+    assert policy.report() == {'saves': 1, 'mean_chars_at_risk': 50.0, 'max_chars_at_risk': 50,
+                               'max_seconds_at_risk': 10.0}
+    assert not policy.coin_flip_only and run.SavePolicy().coin_flip_only
+
+
+def test_synthetic_payload_lines_and_numbering():
+    payload = run.SyntheticPayload(2000, seed=5)
+    lines = list(payload)
+    assert lines[0] == run.PAYLOAD_HEADER
+    assert 2000 <= len(lines) < 2000 + 1 + max(map(len, run.PAYLOAD_TEMPLATES))
+    assert lines == list(payload)
+    numbers = [int(number) for number in re.findall(r'(?:utilFunc|Component)(\d+)_', '\n'.join(lines))]
+    assert sorted(set(numbers)) == list(range(max(numbers) + 1))
+    assert lines.count('') == max(numbers) + 1
+    assert list(run.SyntheticPayload(2000, seed=6)) != lines
+    assert run.Payload(payload).rereadable
+
+
+def test_mark_template_lines_pastes_shared_text():
+    lines = ['function f1(a) {', '  return a + 1;', '}', '',
+             'function f2(a) {', '  return a + 2;', '}', '',
+             'other();']
+    marked = list(run.mark_template_lines((line, False) for line in lines))
+    assert [line for line, _ in marked] == lines
+    assert [paste for _, paste in marked] == [False, False, False, False,
+                                              (10, 11), (13, 14), True, False, False]
+    assert run.changed_span('abc', 'abc') is True
+    assert run.changed_span('f12(x)', 'f3(x)') == (1, 3)
+    assert run.changed_span('ab', 'abab') == (2, 2)